@@ -2,11 +2,66 @@ from calculations.venue_data import VenueData
 from typing import Tuple, Union, Dict, Optional
 from stats.base_stats import BattingStats, PitchingStats
 import random
+from bisect import bisect_left
 
-def determine_field_location() -> str:
+FIELD_LOCATIONS = ('left line', 'left center', 'center', 'right center', 'right line')
+
+DISTANCE_BY_POSITION = {
+    'pitcher': 55,
+    'first base': 90,
+    'second base': 140,
+    'shortstop': 140,
+    'third base': 90,
+    'left field': 300,
+    'center field': 400,
+    'right field': 300
+}
+
+HOME_RUN_LOCATION = {
+    'left line': "Left Field",
+    'right line': "Right Field",
+    'center': "Center Field",
+    'left center': "Left Center Field",
+    'right center': "Right Center Field"
+}
+
+POSITION_MAPPING = {
+    'left line': ['third base', 'left field'],
+    'left center': ['shortstop', 'left field'],
+    'center': ['second base', 'center field', 'pitcher'],
+    'right center': ['first base', 'right field'],
+    'right line': ['first base', 'right field']
+}
+
+def _build_position_boundaries(positions: list) -> Tuple[list, list, list]:
+    """
+    Sort a location's fielders by depth and precompute the midpoints between
+    neighbours. A ball landing exactly on a midpoint goes to whichever fielder
+    comes first in POSITION_MAPPING, matching the old min() tie-break.
+    """
+    ordered = sorted(positions, key=DISTANCE_BY_POSITION.__getitem__)
+    midpoints = []
+    tie_to_shallower = []
+    for shallow, deep in zip(ordered, ordered[1:]):
+        midpoints.append((DISTANCE_BY_POSITION[shallow] + DISTANCE_BY_POSITION[deep]) / 2)
+        tie_to_shallower.append(positions.index(shallow) < positions.index(deep))
+    return ordered, midpoints, tie_to_shallower
+
+_POSITION_BOUNDARIES = {
+    location: _build_position_boundaries(positions)
+    for location, positions in POSITION_MAPPING.items()
+}
 
-    possible_locations = ['left line', 'left center', 'center', 'right center', 'right line']
-    return random.choice(possible_locations)
+def closest_position(location: str, distance: float) -> str:
+    """Fielder at location whose depth is nearest to distance"""
+    ordered, midpoints, tie_to_shallower = _POSITION_BOUNDARIES[location]
+    i = bisect_left(midpoints, distance)
+    if i < len(midpoints) and midpoints[i] == distance and not tie_to_shallower[i]:
+        i += 1
+    return ordered[i]
+
+def determine_field_location() -> str:
+    return random.choice(FIELD_LOCATIONS)
 
 def calculate_hit (
     batter_stats: Union[Dict, BattingStats], pitcher_stats: Union[Dict, PitchingStats], exit_velocity: float, hit_type: str, 
@@ -45,12 +100,8 @@ def calculate_hit (
     else:
         avg_distance = batter_stats.distance['avg']
 
-    def calculate_elevation_factor(elev: int) -> float:
-        return 1.0 + (venue.elevation / 5280) * 0.08 
-    
     if venue.elevation is not None:
-        elevation_factor = calculate_elevation_factor(venue.elevation)
-        initial_distance = initial_distance * (1 + (elevation_factor - 1) * 0.7)
+        initial_distance = initial_distance * (1 + (venue.elevation_factor - 1) * 0.7)
 
     velocity_factor = (exit_velocity - 85) * 1.5
     if exit_velocity > 100:
@@ -76,50 +127,13 @@ def calculate_hit (
 
 
 
-    distance_by_position = {
-        'pitcher': 55,
-        'first base': 90,
-        'second base': 140,
-        'shortstop': 140,
-        'third base': 90,
-        'left field': 300,
-        'center field': 400,
-        'right field': 300
-    }
-    
-    home_run_location = {
-        'left line': "Left Field",
-        'right line': "Right Field",
-        'center': "Center Field",
-        'left center': "Left Center Field",
-        'right center': "Right Center Field"
-    }
-    
-    home_run_min = {
-        'left line': venue.left_line,
-        'right line': venue.right_line,
-        'center': venue.center,
-        'left center': venue.left_center,
-        'right center': venue.right_center
-    }
-    
-    position_mapping = {
-        'left line': ['third base', 'left field'],
-        'left center': ['shortstop', 'left field'],
-        'center': ['second base', 'center field', 'pitcher'],
-        'right center': ['first base', 'right field'],
-        'right line': ['first base', 'right field']
-    }
-    
-    possible_positions = position_mapping[final_location]
-    location_str = min(possible_positions, 
-                      key=lambda x: abs(distance_by_position[x] - adjusted_distance))
+    location_str = closest_position(final_location, adjusted_distance)
       
 
     if hit_type == 'hits a home run':
-        min_distance = home_run_min[final_location]
+        min_distance = venue.hr_minimum(final_location)
         adjusted_distance = random.randint(min_distance, min(min_distance + 75, 500))
-        return adjusted_distance, home_run_location[final_location]
+        return adjusted_distance, HOME_RUN_LOCATION[final_location]
    
         
-    return (round(adjusted_distance, 1), location_str)
\ No newline at end of file
+    return (round(adjusted_distance, 1), location_str)
@@ -1,44 +1,41 @@
 
 import random
+from types import MappingProxyType
 
-def adjust_for_pitch_type(velocity: float, pitch_type) -> float:
-    adjustments = {
-        'FF': 1.5,   # Four-seam fastball
-        'FT': 1.0,   # Two-seam fastball
-        'FC': -2.0,  # Cutter
-        'SL': -5.0,  # Slider
-        'CH': -8.0,  # Changeup
-        'CU': -8.0,  # Curveball
-        'KC': -8.0,  # Knuckle-curve
-        'SF': -4.0,  # Split-finger
-        'EP': -20.0, # Eephus
-        'KN': -20.0  # Knuckleball
-    }
-    
-    if pitch_type:
-        if hasattr(pitch_type, 'name'): 
-            pitch_type_str = pitch_type.name
-        elif hasattr(pitch_type, 'value'):  
-            pitch_type_str = str(pitch_type.value)
-        else:  
-            pitch_type_str = str(pitch_type)
-            
-        return velocity + adjustments.get(pitch_type_str, 0)
+_PITCH_ADJ = MappingProxyType({
+    'FF': 1.5,   # Four-seam fastball
+    'FT': 1.0,   # Two-seam fastball
+    'FC': -2.0,  # Cutter
+    'SL': -5.0,  # Slider
+    'CH': -8.0,  # Changeup
+    'CU': -8.0,  # Curveball
+    'KC': -8.0,  # Knuckle-curve
+    'SF': -4.0,  # Split-finger
+    'EP': -20.0, # Eephus
+    'KN': -20.0  # Knuckleball
+})
 
-    return velocity  
+def _pitch_code(pitch_type) -> str:
+    """Normalize a pitch type (enum, object or string) to its two-letter code"""
+    if type(pitch_type) is str:
+        return pitch_type
+    if not pitch_type:
+        return ''
+    return str(getattr(pitch_type, 'name', None) or getattr(pitch_type, 'value', None) or pitch_type)
 
-def estimate_pitch_velocity(stats, last_pitch):
-    avg_release_speed = stats.get('release_speed', {}).get('avg', 90.0)
-    min_release_speed = stats.get('release_speed', {}).get('min', 80.0)
-    max_release_speed = stats.get('release_speed', {}).get('max', 100.0)
-    
-    avg_effective_speed = stats.get('effective_speed', {}).get('avg', 88.0)
-    min_effective_speed = stats.get('effective_speed', {}).get('min', 78.0)
-    max_effective_speed = stats.get('effective_speed', {}).get('max', 98.0)
+def _pitch_type_adjustment(pitch_type) -> float:
+    """Velocity delta (mph) for a pitch type relative to the pitcher's average"""
+    return _PITCH_ADJ.get(_pitch_code(pitch_type), 0.0)
+
+def adjust_for_pitch_type(velocity: float, pitch_type) -> float:
+    return velocity + _pitch_type_adjustment(pitch_type)
 
+def _pitch_velocity_core(avg_release_speed: float, min_release_speed: float, max_release_speed: float,
+                         avg_effective_speed: float, min_effective_speed: float, max_effective_speed: float,
+                         pitch_adjustment: float, noise: float) -> float:
+    """Float-only body of estimate_pitch_velocity; noise is drawn by the caller"""
     pitch_velocity = avg_release_speed if avg_release_speed else avg_effective_speed
-    
-    pitch_velocity = adjust_for_pitch_type(pitch_velocity, last_pitch)
+    pitch_velocity += pitch_adjustment
     
     velocity_difference = float(avg_effective_speed - pitch_velocity)
     pitch_velocity += velocity_difference * 0.1  
@@ -52,5 +49,20 @@ def estimate_pitch_velocity(stats, last_pitch):
         historical_ratio = pitch_velocity / avg_release_speed
         pitch_velocity = avg_release_speed * max(0.9, min(1.1, historical_ratio))  
     
-    pitch_velocity += random.uniform(-1.0, 1.0) 
-    return round(pitch_velocity, 1)
\ No newline at end of file
+    return pitch_velocity + noise
+
+def estimate_pitch_velocity(stats, last_pitch):
+    release_speed = stats.get('release_speed', {})
+    effective_speed = stats.get('effective_speed', {})
+    
+    pitch_velocity = _pitch_velocity_core(
+        release_speed.get('avg', 90.0),
+        release_speed.get('min', 80.0),
+        release_speed.get('max', 100.0),
+        effective_speed.get('avg', 88.0),
+        effective_speed.get('min', 78.0),
+        effective_speed.get('max', 98.0),
+        _pitch_type_adjustment(last_pitch),
+        random.uniform(-1.0, 1.0)
+    )
+    return round(pitch_velocity, 1)
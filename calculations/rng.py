@@ -0,0 +1,41 @@
+import numpy as np
+import random
+import weakref
+from typing import Optional
+
+# Shared generator for every batch draw in the calculations package
+RNG = np.random.default_rng()
+
+_BUFFERS = weakref.WeakSet()
+
+
+class UniformBuffer:
+    """Hands out uniforms from RNG one at a time, drawing them in blocks"""
+    __slots__ = ('size', '_values', '_index', '__weakref__')
+
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self._values = []
+        self._index = 0
+        _BUFFERS.add(self)
+
+    def next(self) -> float:
+        index = self._index
+        if index == len(self._values):
+            self._values = RNG.random(self.size).tolist()
+            index = 0
+        self._index = index + 1
+        return self._values[index]
+
+    def clear(self) -> None:
+        """Drop pre-drawn values so the next draw comes from the current RNG state"""
+        self._values = []
+        self._index = 0
+
+
+def seed(value: Optional[int] = None) -> None:
+    """Reseed the shared generator, its uniform buffers and stdlib random used by scalar paths"""
+    RNG.bit_generator.state = np.random.PCG64(value).state
+    random.seed(value)
+    for buffer in list(_BUFFERS):
+        buffer.clear()
@@ -1,8 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Dict, Optional
 
+# Field location -> VenueData attribute holding that fence distance
+FENCE_FIELDS = {
+    'left line': 'left_line',
+    'left center': 'left_center',
+    'center': 'center',
+    'right center': 'right_center',
+    'right line': 'right_line'
+}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class VenueData:
     """Contains relevant venue information for hit calculations"""
     name: str
@@ -14,24 +23,35 @@ class VenueData:
     elevation: Optional[int] = 600
     turf_type: Optional[str] = 'grass'
     roof_type: Optional[str] = 'open'
+    elevation_factor: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Thin-air carry multiplier, computed once per venue instead of per hit
+        factor = 1.0 + (self.elevation / 5280) * 0.08 if self.elevation is not None else 1.0
+        object.__setattr__(self, 'elevation_factor', factor)
 
     @classmethod
     def from_api_response(cls, venue_data: Dict) -> 'VenueData':
         venue_info = venue_data.get('venues', [{}])[0]
         field_info = venue_info.get('fieldInfo', {})
+        defaults = {f.name: f.default for f in fields(cls)}
         
         return cls(
             name=venue_info.get('name', 'Unknown Venue'),
-            left_line=field_info.get('leftLine', cls.left_line),
-            left_center=field_info.get('leftCenter', cls.left_center),
-            center=field_info.get('center', cls.center),
-            right_center=field_info.get('rightCenter', cls.right_center),
-            right_line=field_info.get('rightLine', cls.right_line),
-            elevation=venue_info.get('location', {}).get('elevation', cls.elevation),
-            turf_type=field_info.get('turfType', cls.turf_type),
-            roof_type=field_info.get('roofType', cls.roof_type)
+            left_line=field_info.get('leftLine', defaults['left_line']),
+            left_center=field_info.get('leftCenter', defaults['left_center']),
+            center=field_info.get('center', defaults['center']),
+            right_center=field_info.get('rightCenter', defaults['right_center']),
+            right_line=field_info.get('rightLine', defaults['right_line']),
+            elevation=venue_info.get('location', {}).get('elevation', defaults['elevation']),
+            turf_type=field_info.get('turfType', defaults['turf_type']),
+            roof_type=field_info.get('roofType', defaults['roof_type'])
         )
 
+    def hr_minimum(self, location: str) -> int:
+        """Fence distance a ball hit to location must clear for a home run"""
+        return getattr(self, FENCE_FIELDS[location])
+
     def get_venue_data(self) -> Dict:
         """Return venue data as a dictionary"""
         return {
@@ -1,4 +1,5 @@
 import re
+from types import MappingProxyType
 
 MAX_STRIKES = 2  
 MAX_BALLS = 3
@@ -45,7 +46,19 @@ DEFAULT_ARSENAL = {
 }
             
     
-DEFAULT_STATS = {
+def _freeze(value):
+    """Recursively wrap shared default dicts in read-only proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+def thaw(value):
+    """Mutable deep copy of a frozen default, safe to hand to callers or serialize"""
+    if isinstance(value, MappingProxyType):
+        return {k: thaw(v) for k, v in value.items()}
+    return value
+
+DEFAULT_STATS = _freeze({
     'hitting': {
         'avg': 0.252,             # League average BA
         'obp': 0.317,             # League average OBP
@@ -145,9 +158,9 @@ DEFAULT_STATS = {
             'max': 102.0     # Maximum fastball velocity
         }
     }
-}
+})
 
-DEFAULT_METRICS = {
+DEFAULT_METRICS = _freeze({
     'launch_speed': {  # Exit velocity
         'avg': 88.0,   # MLB average is around 88-89 mph
         'min': 65.0,   # Weak contact/check swings
@@ -173,9 +186,13 @@ DEFAULT_METRICS = {
         'min': 75.0,     # Slow pitches (curves, changeups)
         'max': 102.0     # Maximum fastball velocity
     }
-}
+})
+
+# (avg, min, max) exit velocity fallback for hot paths
+DEFAULT_LAUNCH_SPEED = (88.0, 65.0, 115.0)
 
-team_mapping = {
+# Keyed by int team id so callers holding the numeric id skip a str() conversion
+team_mapping = {int(team_id): name for team_id, name in {
 	"108": "Los Angeles Angels",
 	"109": "Arizona Diamondbacks",
 	"110": "Baltimore Orioles",
@@ -208,7 +225,7 @@ team_mapping = {
 	"158": "Milwaukee Brewers",
 	"159": "AL All-Stars",
 	"160": "NL All-Stars"
-}
+}.items()}
 
 PITCH_CODES = {
     'FA': 'Fastball',
@@ -229,7 +246,7 @@ PITCH_CODES = {
     'FS': 'Splitter'
 }
 
-RAW_PITCH_CODES = {    
+RAW_PITCH_CODES = frozenset({    
     'FA',
     'FF',
     'FT',
@@ -246,55 +263,67 @@ RAW_PITCH_CODES = {
     'SC',
     'CS',
     'FS'
-}
+})
 
 REQUIRED_POSITIONS = ['C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF']
 
 
 ACTION_MAP =  {
-    re.compile(r'.*\b(ground(ed|s)?|hits? a grounder)\b.*', re.IGNORECASE): 'grounds out',
-    re.compile(r'.*\b(fly(ing|s)?|flies|flied|flew|pop(s|ped)?)\b.*', re.IGNORECASE): 'flies out',
-    re.compile(r'.*\b(line(d|s)?|hits? a liner)\b.*', re.IGNORECASE): 'lines out',
-    re.compile(r'.*\b(single[sd]?|hits? a single[sd]?)\b.*', re.IGNORECASE): 'singles',
-    re.compile(r'.*\b(double[sd]?|hits? a double[sd]?)\b.*', re.IGNORECASE): 'doubles',
-    re.compile(r'.*\b(triple[sd]?|hits? a triple[sd]?)\b.*', re.IGNORECASE): 'triples',
-    re.compile(r'.*\b(home ?run[s]?|homer[s]?|hits? a home ?run)\b.*', re.IGNORECASE): 'hits a home run',
-    re.compile(r'.*\b(walk[sed]?|base on balls|draws? a walk)\b.*', re.IGNORECASE): 'walks',
-    re.compile(r'.*\b(strike(s)? ?out|struck out|whiff[sed]?|k\'s?)\b.*', re.IGNORECASE): 'strikeout',
+    re.compile(r'\b(ground(ed|s)?|hits? a grounder)\b', re.IGNORECASE): 'grounds out',
+    re.compile(r'\b(fly(ing|s)?|flies|flied|flew|pop(s|ped)?)\b', re.IGNORECASE): 'flies out',
+    re.compile(r'\b(line(d|s)?|hits? a liner)\b', re.IGNORECASE): 'lines out',
+    re.compile(r'\b(single[sd]?|hits? a single[sd]?)\b', re.IGNORECASE): 'singles',
+    re.compile(r'\b(double[sd]?|hits? a double[sd]?)\b', re.IGNORECASE): 'doubles',
+    re.compile(r'\b(triple[sd]?|hits? a triple[sd]?)\b', re.IGNORECASE): 'triples',
+    re.compile(r'\b(home ?run[s]?|homer[s]?|hits? a home ?run)\b', re.IGNORECASE): 'hits a home run',
+    re.compile(r'\b(walk[sed]?|base on balls|draws? a walk)\b', re.IGNORECASE): 'walks',
+    re.compile(r'\b(strike(s)? ?out|struck out|whiff[sed]?|k\'s?)\b', re.IGNORECASE): 'strikeout',
 }
 
 
 LOCATION_MAP = {
-    re.compile(r'.*\bshort stop(s)?\b.*', re.IGNORECASE): 'shortstop',
-    re.compile(r'.*\bSS?\b.*', re.IGNORECASE): 'shortstop',
-    re.compile(r'.*\b1B?\b.*', re.IGNORECASE): 'first base',
-    re.compile(r'.*\bfirst?\b.*', re.IGNORECASE): 'first base',
-    re.compile(r'.*\b2B?\b.*', re.IGNORECASE): 'second base',
-    re.compile(r'.*\bsecond?\b.*', re.IGNORECASE): 'second base',
-    re.compile(r'.*\b3B?\b.*', re.IGNORECASE): 'third base',
-    re.compile(r'.*\bthird?\b.*', re.IGNORECASE): 'third base',
-    re.compile(r'.*\bLF?\b.*', re.IGNORECASE): 'left field',
-    re.compile(r'.*\bleft?\b.*', re.IGNORECASE): 'left field',
-    re.compile(r'.*\bCF?\b.*', re.IGNORECASE): 'center field',
-    re.compile(r'.*\bcenter?\b.*', re.IGNORECASE): 'center field',
-    re.compile(r'.*\bRF?\b.*', re.IGNORECASE): 'right field',
-    re.compile(r'.*\bright?\b.*', re.IGNORECASE): 'right field',
-    re.compile(r'.*\bmiddle?\b.*', re.IGNORECASE): 'center field',
+    re.compile(r'\bshort stop(s)?\b', re.IGNORECASE): 'shortstop',
+    re.compile(r'\bSS?\b', re.IGNORECASE): 'shortstop',
+    re.compile(r'\b1B?\b', re.IGNORECASE): 'first base',
+    re.compile(r'\bfirst?\b', re.IGNORECASE): 'first base',
+    re.compile(r'\b2B?\b', re.IGNORECASE): 'second base',
+    re.compile(r'\bsecond?\b', re.IGNORECASE): 'second base',
+    re.compile(r'\b3B?\b', re.IGNORECASE): 'third base',
+    re.compile(r'\bthird?\b', re.IGNORECASE): 'third base',
+    re.compile(r'\bLF?\b', re.IGNORECASE): 'left field',
+    re.compile(r'\bleft?\b', re.IGNORECASE): 'left field',
+    re.compile(r'\bCF?\b', re.IGNORECASE): 'center field',
+    re.compile(r'\bcenter?\b', re.IGNORECASE): 'center field',
+    re.compile(r'\bRF?\b', re.IGNORECASE): 'right field',
+    re.compile(r'\bright?\b', re.IGNORECASE): 'right field',
+    re.compile(r'\bmiddle?\b', re.IGNORECASE): 'center field',
 }
 
+def _fuse_patterns(pattern_map: dict):
+    """Fuse an ordered pattern map into one regex; earlier patterns keep priority"""
+    results = {}
+    branches = []
+    for i, (pattern, result) in enumerate(pattern_map.items()):
+        name = f'p{i}'
+        results[name] = result
+        branches.append(f'(?P<{name}>(?=.*?(?:{pattern.pattern})))')
+    return re.compile('|'.join(branches), re.IGNORECASE).match, results
+
+_LOCATION_MATCH, _LOCATION_RESULTS = _fuse_patterns(LOCATION_MAP)
+_ACTION_MATCH, _ACTION_RESULTS = _fuse_patterns(ACTION_MAP)
+
 def map_location(location: str) -> str:
     """Map a location string to its corresponding standardized position."""
-    for pattern, result in LOCATION_MAP.items():
-        if pattern.match(location):
-            return result
+    match = _LOCATION_MATCH(location)
+    if match:
+        return _LOCATION_RESULTS[match.lastgroup]
     return location 
     
     
     
 def map_action(action: str) -> str:
     """Map an action string to its corresponding standardized action."""
-    for pattern, result in ACTION_MAP.items():
-        if pattern.match(action):
-            return result
+    match = _ACTION_MATCH(action)
+    if match:
+        return _ACTION_RESULTS[match.lastgroup]
     return action  
-
@@ -0,0 +1,58 @@
+from typing import Callable, Optional, TypeVar
+import threading
+import time
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint that has been failing repeatedly"""
+
+
+class CircuitBreaker:
+    """
+    Fails fast after fail_max consecutive failures, so a down endpoint does
+    not cost a full timeout per call. After reset_timeout seconds one trial
+    call is let through; success closes the circuit, failure reopens it.
+    Errors rejected by is_failure (e.g. a 404) propagate without counting.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0,
+                 is_failure: Optional[Callable[[BaseException], bool]] = None):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        is_trial = False
+        with self._lock:
+            if self._opened_at is not None:
+                if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit open after {self._failures} consecutive failures")
+                # Half-open: this caller makes the trial call; others fail fast until it finishes
+                self._trial_in_flight = True
+                is_trial = True
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure is not None and not self.is_failure(e):
+                raise
+            with self._lock:
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    self._opened_at = time.monotonic()
+            raise
+        finally:
+            if is_trial:
+                with self._lock:
+                    self._trial_in_flight = False
+
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+        return result
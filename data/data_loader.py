@@ -1,14 +1,18 @@
-from typing import Dict
-from functools import lru_cache
-from data.mlb_client import MLBDataClient
+from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from data.mlb_client import get_shared_client, shared_cache
 from stats.centralized_stats import CentralizedStatsService
 
 
 class TeamDataLoader:
-    """Handles all raw data loading from MLB API"""
+    """
+    Handles all raw data loading from MLB API. Responses are cached by the
+    shared MLBDataClient, which only caches successful calls; the {} fallbacks
+    here are returned per call and never cached.
+    """
     
     def __init__(self):
-        self.mlb_client = MLBDataClient()
+        self.mlb_client = get_shared_client()
         self.stats_processor = CentralizedStatsService()
         
     def get_team_details(self, team_id: int, year: int) -> Dict:
@@ -18,7 +22,6 @@ class TeamDataLoader:
         except Exception as e:
             return {}
             
-    @lru_cache(maxsize=128)
     def get_player_stats(self, player_id: int, year: int) -> Dict:
         """Get raw player statistics"""
         try:
@@ -26,7 +29,6 @@ class TeamDataLoader:
         except Exception as e:
             return {}
 
-    @lru_cache(maxsize=128)
     def get_venue_data(self, team_id: int, year: int) -> Dict:
         """Get raw venue data"""
         try:
@@ -34,7 +36,6 @@ class TeamDataLoader:
         except Exception as e:
             return {}
         
-    @lru_cache(maxsize=128)
     def get_pitchers(self, team_id: int, year: int) -> Dict:
         """Get raw pitcher data"""
         try:
@@ -42,7 +43,6 @@ class TeamDataLoader:
         except Exception as e:
             return {}
 
-    @lru_cache(maxsize=128)
     def get_pitch_arsenal(self, pitcher_id: int, year: int) -> Dict:
         """Get raw pitch arsenal data"""
         try:
@@ -50,14 +50,29 @@ class TeamDataLoader:
         except Exception as e:
             return {}
 
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
+    def _load_processed_team(self, team_id: int, year: int) -> Dict:
+        """Fetch and process a roster; errors propagate so a failed load is never cached"""
+        team_data = self.mlb_client.get_roster_with_stats(team_id, year)
+        processed_data = self.stats_processor.process_team_stats(team_data, year)
+        if not processed_data.get('players'):
+            raise ValueError(f"No players processed for team {team_id} in {year}")
+        return processed_data
+
     def load_complete_team_data(self, team_id: int, year: int) -> Dict:
         """Load all raw team data in coordinated fashion"""
         try:
- 
-            team_data = self.mlb_client.get_roster_with_stats(team_id, year)
-            processed_data = self.stats_processor.process_team_stats(team_data, year)
-            return processed_data
-
+            return self._load_processed_team(team_id, year)
         except Exception as e:
             return {}
+
+    def load_matchup_data(self, away_team: int, away_year: int, home_team: int, home_year: int) -> Tuple[Dict, Dict, Dict]:
+        """Load both rosters and the home venue concurrently"""
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            away_future = pool.submit(self.load_complete_team_data, away_team, away_year)
+            home_future = pool.submit(self.load_complete_team_data, home_team, home_year)
+            venue_future = pool.submit(self.get_venue_data, home_team, home_year)
+            # Warm the pitcher leader cache used later by team creation
+            pool.submit(self.get_pitchers, away_team, away_year)
+            pool.submit(self.get_pitchers, home_team, home_year)
+            return away_future.result(), home_future.result(), venue_future.result()
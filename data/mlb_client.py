@@ -1,26 +1,65 @@
 from typing import Dict, Optional
 import httpx
-from functools import lru_cache
-from tenacity import retry, stop_after_attempt
+import threading
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
+from datetime import datetime
+from functools import cache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from data.circuit_breaker import CircuitBreaker
+from data.response_cache import ResponseCache
+from utils import fast_json
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+CURRENT_SEASON_TTL = 24 * 60 * 60
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Network errors, throttling and server errors are worth retrying; other 4xx are not"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def shared_cache(maxsize: int = 128):
+    """
+    LRU cache for methods that is shared by every instance of the class.
+    Unlike lru_cache on a method, self is left out of the key, so new
+    instances reuse earlier results and are not pinned in memory.
+    """
+    return cached(LRUCache(maxsize=maxsize), key=lambda self, *args, **kwargs: hashkey(*args, **kwargs),
+                  lock=threading.Lock())
 
 
 class MLBDataClient():
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, cache_path: Optional[str] = '.mlb_cache.sqlite'):
         self.base_url = "https://statsapi.mlb.com/api/v1"
-        self.client = httpx.Client(timeout=timeout)
+        self.client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=timeout,
+            headers={'Accept-Encoding': 'gzip, deflate'},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0)
+        )
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        self.breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0, is_failure=_is_transient)
 
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_venue_details(self, team_id: int, year: int) -> Dict:
         """Get venue details for a specific venue"""
         team_data = self.get_team_details(team_id, year)
         team_info = team_data['teams'][0]
         venue_id = team_info['venue']['id']
         url = f"{self.base_url}/venues?venueIds={venue_id}&hydrate=location,fieldInfo"
-        response = self._make_request(url, {})
+        response = self._make_request(url, {}, self._season_ttl(year))
         return response
     
     
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_stats(self, player_id: int, year: int) -> Dict:
         url = f"{self.base_url}/people/{player_id}"
         params = {
@@ -28,12 +67,12 @@ class MLBDataClient():
             "hydrate": f"stats(group=[hitting,pitching],type=[career,statSplits,metricAverages,careerAdvanced],metrics=[launchSpeed,distance,launchAngle,releaseSpeed],sitCodes=[vr,vl],season={year})"
         }
         
-        response = self._make_request(url, params)
+        response = self._make_request(url, params, self._season_ttl(year))
         
         
         return response
     
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_team_roster(self, team_id: int, season: int) -> Dict:
         """Get raw team roster data"""
         
@@ -43,29 +82,23 @@ class MLBDataClient():
             "rosterType": "fullSeason"
         }
         
-        response = self._make_request(url, params)
+        response = self._make_request(url, params, self._season_ttl(season))
         return response
             
        
         
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_team_details(self, team_id: int, year: int) -> Dict:
         """Get team details including first year of play and venue"""
-        try:
-            url = f"{self.base_url}/teams/{team_id}?season={year}"
-            params = {
-                "hydrate": "venue", 
-                "fields": "teams,id,name,firstYearOfPlay,venue"
-            }
-            
-            response = self._make_request(url, params)
-
-            return response
-            
-        except Exception as e:
-            raise ValueError(f"Error fetching team details for {team_id}: {e}")
+        url = f"{self.base_url}/teams/{team_id}?season={year}"
+        params = {
+            "hydrate": "venue", 
+            "fields": "teams,id,name,firstYearOfPlay,venue"
+        }
+        
+        return self._make_request(url, params, self._season_ttl(year))
             
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_pitchers(self, team_id, year: int) -> Dict:
     
         url = f"{self.base_url}/teams/{team_id}/leaders?leaderCategories=inningsPitched&season={year}"
@@ -73,11 +106,11 @@ class MLBDataClient():
             "season": year, 
         }
         
-        response = self._make_request(url, params)
+        response = self._make_request(url, params, self._season_ttl(year))
 
         return response
            
-    @lru_cache(maxsize=128)
+    @shared_cache(maxsize=128)
     def get_pitch_arsenal(self, pitcher_id, year: int) -> Dict:
         """Get a pitcher's pitch arsenal for a specific season"""
         url = f"{self.base_url}/people/{pitcher_id}"
@@ -86,25 +119,46 @@ class MLBDataClient():
             "hydrate": f"stats(group=[pitching],type=[pitchArsenal,career],season={year})"
         }
         
-        response = self._make_request(url, params)
+        response = self._make_request(url, params, self._season_ttl(year))
         return response
 
-    @lru_cache(maxsize=128)
-    @retry(stop=(stop_after_attempt(3)))
+    @shared_cache(maxsize=128)
     def get_roster_with_stats(self, team_id: int, year: int) -> Dict:
         """Get team roster with player stats"""
         url=f"{self.base_url}/teams/{team_id}/roster?rosterType=Active&season={year}&hydrate=person(stats(group=[hitting,pitching],type=[career,careerAdvanced,metricAverages,sabermetrics],metrics=[launchSpeed,distance,launchAngle,releaseSpeed])%3A%29"
 
-        response = self.client.get(url)
-        response.raise_for_status() 
-        return response.json()      
+        return self._make_request(url, None, self._season_ttl(year))
     
+    @staticmethod
+    def _season_ttl(year: int) -> Optional[int]:
+        """Completed seasons never change; the current one is refreshed daily"""
+        return None if int(year) < datetime.now().year else CURRENT_SEASON_TTL
+
+    def _make_request(self, url: str, params: Optional[Dict], ttl: Optional[int] = CURRENT_SEASON_TTL) -> Optional[Dict]:
+        cache_key = ResponseCache.make_key(url, params)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-    def _make_request(self, url: str, params: Dict) -> Optional[Dict]:
         try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status() 
-            return response.json()
-        
+            data = self.breaker.call(self._fetch, url, params)
         except Exception as e:
-            raise ValueError(f"Error fetching data from {url}: {e}")
\ No newline at end of file
+            raise ValueError(f"Error fetching data from {url}: {e}") from e
+
+        if self.cache:
+            self.cache.set(cache_key, data, ttl)
+        return data
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.3, max=5),
+           retry=retry_if_exception(_is_transient), reraise=True)
+    def _fetch(self, url: str, params: Optional[Dict]) -> Dict:
+        response = self.client.get(url, params=params)
+        response.raise_for_status()
+        return fast_json.loads(response.content)
+
+
+@cache
+def get_shared_client() -> MLBDataClient:
+    """Process-wide MLBDataClient so callers share one connection pool"""
+    return MLBDataClient()
@@ -0,0 +1,46 @@
+from typing import Any, Optional
+import json
+import sqlite3
+import threading
+import time
+from utils import fast_json
+
+
+class ResponseCache:
+    """SQLite-backed cache for MLB API responses that persists across runs"""
+
+    def __init__(self, path: str = '.mlb_cache.sqlite'):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, body TEXT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """Build a stable key from a URL and its query params"""
+        return json.dumps([url, sorted((params or {}).items())], default=str)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        expires, body = row
+        if expires is not None and expires < time.time():
+            return None
+        return fast_json.loads(body)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a response; ttl of None keeps it forever"""
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+                (key, expires, fast_json.dumps(value))
+            )
+            self._conn.commit()
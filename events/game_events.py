@@ -1,6 +1,12 @@
 from dataclasses import dataclass
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Callable, Any, Tuple
 from datetime import datetime
+from operator import attrgetter
+
+_DISPLAY_KEYS = ('batter', 'pitcher', 'action', 'location', 'quality', 'exit_velocity',
+                 'base_runners', 'scored_runners', 'defensive_play', 'description')
+_DISPLAY_VALUES = attrgetter('batter_name', 'pitcher_name', 'action', 'location', 'quality', 'exit_velocity',
+                             'base_runners', 'scored_runners', 'defensive_play', 'description')
 
 @dataclass
 class PlayResult:
@@ -18,18 +24,10 @@ class PlayResult:
 
     def format_for_display(self) -> Dict:
         """Format play result for frontend display"""
-        return {
-            'batter': self.batter_name,
-            'pitcher': self.pitcher_name,
-            'action': self.action,
-            'location': self.location,
-            'quality': self.quality,
-            'exit_velocity': self.exit_velocity,
-            'base_runners': self.base_runners or [],
-            'scored_runners': self.scored_runners or [],
-            'defensive_play': self.defensive_play,
-            'description': self.description
-        }
+        display = dict(zip(_DISPLAY_KEYS, _DISPLAY_VALUES(self)))
+        display['base_runners'] = display['base_runners'] or []
+        display['scored_runners'] = display['scored_runners'] or []
+        return display
 
         
 @dataclass
@@ -49,24 +47,23 @@ class EventManager:
             'score': {},
             'base_state': []
         }
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # Callbacks are stored as tuples, rebuilt on (rare) subscribe/unsubscribe, so emit iterates a fixed sequence
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
         
     def subscribe(self, event_type: str, callback: Callable) -> None:
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
         
     def emit(self, event_type: str, data: Dict) -> None:
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    raise RuntimeError(f"Error in event callback: {e}")
+        callbacks = self._subscribers.get(event_type)
+        if callbacks is None:
+            return
+        # Callback errors propagate as raised; callers already handle them
+        for callback in callbacks:
+            callback(data)
                     
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         if event_type in self._subscribers:
-            self._subscribers[event_type] = [
+            self._subscribers[event_type] = tuple(
                 cb for cb in self._subscribers[event_type] 
                 if cb != callback
-            ]
+            )
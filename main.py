@@ -1,5 +1,15 @@
-import eventlet
-eventlet.monkey_patch()
+import os
+
+# eventlet for local development; set SOCKETIO_ASYNC_MODE=gevent_uwsgi when serving
+# under uWSGI's gevent loop (see README)
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'eventlet')
+
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE in ('gevent', 'gevent_uwsgi'):
+    from gevent import monkey
+    monkey.patch_all()
 
 from flask import Flask, render_template, jsonify, request, session
 from flask_socketio import SocketIO, emit
@@ -8,30 +18,48 @@ from constants import team_mapping
 from utils.custom_serializer import serialize_game_object_to_dict
 from services.game_statistics_summary import GameStatsManager
 from sim.historical_simulator import HistoricalMatchupSimulator
-from data.mlb_client import MLBDataClient
+from data.mlb_client import get_shared_client
 from events.game_events import EventManager
 from data.data_loader import TeamDataLoader
 from stats.centralized_stats import CentralizedStatsService
 from utils.gemini_config import get_llm
+from utils.fast_json import SocketIOJSON
 from datetime import datetime
 
-import os
+
+# Reverse index for start_game; first id wins, like the scan it replaces
+_TEAM_IDS_BY_NAME = {}
+for _team_id, _team_name in team_mapping.items():
+    _TEAM_IDS_BY_NAME.setdefault(_team_name, _team_id)
 
 
+def team_id_for(name: str):
+    """Look up a team id by full name, falling back to a partial-name match"""
+    team_id = _TEAM_IDS_BY_NAME.get(name)
+    if team_id is None:
+        team_id = next((id for id, team_name in team_mapping.items() if name in team_name), None)
+    return team_id
+
 
 app = Flask(__name__)
 CORS(app)
 socketio = SocketIO(app, 
                    cors_allowed_origins="*",
-                   async_mode='eventlet',
-                   ping_timeout=10,
-                   ping_interval=5)
+                   async_mode=ASYNC_MODE,
+                   json=SocketIOJSON,
+                   ping_timeout=int(os.environ.get('SOCKETIO_PING_TIMEOUT', 10)),
+                   ping_interval=int(os.environ.get('SOCKETIO_PING_INTERVAL', 5)))
+
+# Seconds between plays in the live view; 0 streams plays as fast as they simulate
+PLAY_DELAY_SECONDS = float(os.environ.get('PLAY_DELAY_SECONDS', 7))
 
+# team_mapping is constant, so the /api/teams payload is encoded once
+_TEAMS_JSON = app.json.dumps({id: name for id, name in team_mapping.items() if "All-Stars" not in name}, separators=(",", ":")) + "\n"
 
 def initialize_components():
     """Initialize all game components with dependencies"""
     try:
-        mlb_client = MLBDataClient()
+        mlb_client = get_shared_client()
         team_data_loader = TeamDataLoader()
         stats_service = CentralizedStatsService()
         event_manager = EventManager()
@@ -45,6 +73,15 @@ def initialize_components():
     except Exception as e:
         raise
 
+# Built at import so WSGI servers that never run __main__ (uWSGI --wsgi-file) get them too
+try:
+    components = initialize_components()
+    mlb_client = components['mlb_client']
+    event_manager = components['event_manager']
+    team_data_loader = components['team_data_loader']
+except Exception as e:
+    raise ValueError(f"Failed to initialize components: {e}")
+
 @socketio.on('set_api_key')
 def handle_api_key(api_key):
     session['api_key'] = api_key
@@ -54,8 +91,7 @@ def handle_api_key(api_key):
 @app.route('/api/teams')
 def get_teams():
     """Return all teams from team mapping excluding All-Star teams"""
-    teams = {id: name for id, name in team_mapping.items() if "All-Stars" not in name}
-    return jsonify(teams)
+    return app.response_class(_TEAMS_JSON, mimetype=app.json.mimetype)
 
 @app.route('/api/team_details/<team_id>')
 def get_team_details(team_id):
@@ -124,6 +160,12 @@ def validate_api_key():
     
 @socketio.on('start_game')
 def handle_game_simulation(data):
+    # Simulate off the handler so pings keep flowing during long CPU stretches
+    socketio.start_background_task(_run_game, data, request.sid)
+
+
+def _run_game(data, sid):
+    """Simulate one game, emitting plays and the final status over Socket.IO"""
     try:
         api_key = data['api_key']
         model = data['model']
@@ -133,40 +175,37 @@ def handle_game_simulation(data):
             'api_key': api_key
         }
 
-        simulator = HistoricalMatchupSimulator()
+        # Pace plays for the live view, which renders each one as it arrives
+        simulator = HistoricalMatchupSimulator(play_delay=PLAY_DELAY_SECONDS)
         simulator.game_simulator.client = get_llm(**llm_config)
         game_stats_manager = GameStatsManager(home_team=data['home_team'], away_team=data['away_team'])
         game_stats_manager.client = get_llm(**llm_config)
 
-        global home_team_id, away_team_id
         # Get team IDs
-        home_team_id = next((id for id, name in team_mapping.items() 
-                       if data['home_team'] in name), None)
-        away_team_id = next((id for id, name in team_mapping.items() 
-                       if data['away_team'] in name), None)
-
-        global home_team_name, away_team_name
+        home_team_id = team_id_for(data['home_team'])
+        away_team_id = team_id_for(data['away_team'])
         home_team_name = data['home_team']
-        
         away_team_name = data['away_team']
                               
         if not home_team_id or not away_team_id:
             raise ValueError("Invalid team selection")
 
-        global home_year, away_year
         home_year = data['home_year']
         away_year = data['away_year']
 
+        # Per-game locals captured by the callbacks, so concurrent games don't share state
+        team_context = {
+            'away_team_id': away_team_id,
+            'home_team_id': home_team_id,
+            'home_team_name': home_team_name,
+            'away_team_name': away_team_name,
+            'year1': away_year,
+            'year2': home_year,
+        }
+
         def send_play_to_frontend(play_data):
             try:
-                
-                play_data['play_details']['away_team_id'] = away_team_id
-                play_data['play_details']['home_team_id'] = home_team_id
-                
-                play_data['play_details']['home_team_name'] = home_team_name
-                play_data['play_details']['away_team_name'] = away_team_name
-                play_data['play_details']['year1'] = away_year
-                play_data['play_details']['year2'] = home_year
+                play_data['play_details'].update(team_context)
 
                 if hasattr(play_data['play_details']['base_state'], 'to_list'):
                     play_data['play_details']['base_state'] = play_data['play_details']['base_state'].to_list()
@@ -175,10 +214,10 @@ def handle_game_simulation(data):
 
                               
                 serialized_data = serialize_game_object_to_dict(play_data)
-                socketio.emit('play_result', serialized_data)
+                socketio.emit('play_result', serialized_data, to=sid)
                 
             except Exception as e:
-                socketio.emit('game_error', {'message': str(e)})
+                socketio.emit('game_error', {'message': str(e)}, to=sid)
                 raise ValueError(f"Error sending play to frontend: {str(e)}")
                         
         def send_game_over(end_data):
@@ -189,7 +228,7 @@ def handle_game_simulation(data):
                 'innings': end_data['innings'],
                 'game_summary': end_data['game_summary'],
                 'llm_analysis': end_data['llm_analysis']
-            })
+            }, to=sid)
 
         simulator.event_manager.subscribe('play_result', send_play_to_frontend)
         simulator.event_manager.subscribe('game_status', send_game_over)
@@ -208,7 +247,7 @@ def handle_game_simulation(data):
         socketio.emit('game_error', {
             'message': error_msg,
             'type': 'error'
-        })
+        }, to=sid)
         
         
 @app.route('/health')
@@ -220,19 +259,11 @@ def index():
     return render_template('index.html')
 
 if __name__ == '__main__':
-    # Initialize components
-    try:
-        components = initialize_components()
-        mlb_client = components['mlb_client']
-        event_manager = components['event_manager']
-        team_data_loader = components['team_data_loader']
-    except Exception as e:
-        raise ValueError(f"Failed to initialize components: {e}")
-
     # Run the server
     port = int(os.environ.get('PORT', 8080))
+    debug = os.environ.get('FLASK_DEBUG', '1') == '1'
     socketio.run(app, 
                 host='0.0.0.0', 
                 port=port,
-                debug=True,
-                use_reloader=True)
\ No newline at end of file
+                debug=debug,
+                use_reloader=debug)
\ No newline at end of file
@@ -1,67 +1,134 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-import random
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+from calculations.rng import UniformBuffer
+
+
+class PlayKind(IntEnum):
+    """Play outcome categories that drive base running"""
+    OTHER = 0
+    HOME_RUN = 1
+    TRIPLE = 2
+    DOUBLE = 3
+    SINGLE = 4
+    WALK = 5
+    GROUNDOUT = 6
+    FLYOUT = 7
+
+# Checked in order, so the first phrase found in the play text wins
+_PLAY_PHRASES = (
+    ('hits a home run', PlayKind.HOME_RUN),
+    ('triples', PlayKind.TRIPLE),
+    ('doubles', PlayKind.DOUBLE),
+    ('singles', PlayKind.SINGLE),
+    ('walk', PlayKind.WALK),
+    ('grounds out', PlayKind.GROUNDOUT),
+    ('groundout', PlayKind.GROUNDOUT),
+    ('flies out', PlayKind.FLYOUT),
+    ('flyout', PlayKind.FLYOUT),
+    ('fly out', PlayKind.FLYOUT),
+)
+
+@lru_cache(maxsize=256)
+def classify_play(play_type: str) -> PlayKind:
+    """Classify a play description once so base running can branch on an int"""
+    play_type = play_type.lower()
+    for phrase, kind in _PLAY_PHRASES:
+        if phrase in play_type:
+            return kind
+    return PlayKind.OTHER
+
+def _runner_moves(state: int, bases: int, scoring_from: int = 3) -> Tuple[Tuple[Optional[int], ...], Tuple[int, ...]]:
+    """
+    Where each base's new runner comes from (0-2 a base, 3 the batter, None empty)
+    and who scores, in the order the old play-by-play reported them. Runners on
+    or past scoring_from score regardless of `bases`.
+    """
+    new_sources = [None, None, None]
+    scored = []
+    for source in (2, 1, 0, 3):
+        if source < 3 and not state >> source & 1:
+            continue
+        target = (-1 if source == 3 else source) + bases
+        if target >= 3 or (source < 3 and source >= scoring_from):
+            scored.append(source)
+        else:
+            new_sources[target] = source
+    if bases >= 4:
+        # Home runs list the runners from first outward, then the batter
+        scored.sort()
+    return tuple(new_sources), tuple(scored)
+
+# Base occupancy is a 3-bit mask (1 = first, 2 = second, 4 = third). Per PlayKind and state:
+# (new_sources, scored_sources), mirroring determine_advancement followed by update_base_state,
+# with a single's runner from second holding at third
+RUNNER_MOVES = {
+    PlayKind.OTHER: tuple(((0 if state & 1 else None, 1 if state & 2 else None, 2 if state & 4 else None), ())
+                          for state in range(8)),
+    PlayKind.WALK: tuple(_runner_moves(state, 1) for state in range(8)),
+    PlayKind.SINGLE: tuple(_runner_moves(state, 1) for state in range(8)),
+    PlayKind.DOUBLE: tuple(_runner_moves(state, 2) for state in range(8)),
+    PlayKind.TRIPLE: tuple(_runner_moves(state, 3) for state in range(8)),
+    PlayKind.HOME_RUN: tuple(_runner_moves(state, 4) for state in range(8)),
+}
+# A single with second occupied and third empty is a coin flip: this is the runner-scores side
+SINGLE_RUNNER_SCORES_MOVES = tuple(_runner_moves(state, 1, scoring_from=1 if state & 6 == 2 else 3)
+                                   for state in range(8))
 
 @dataclass 
 class BaseState:
-    def __init__(self):
-        self._bases = [None, None, None] 
+    __slots__ = ('first', 'second', 'third')
     
-    @property
-    def first(self):
-        return self._bases[0]
-        
-    @first.setter
-    def first(self, value):
-        self._bases[0] = value
-        
-    @property
-    def second(self):
-        return self._bases[1]
-        
-    @second.setter 
-    def second(self, value):
-        self._bases[1] = value
-        
-    @property
-    def third(self):
-        return self._bases[2]
-        
-    @third.setter
-    def third(self, value):
-        self._bases[2] = value
+    def __init__(self, first: Optional[str] = None, second: Optional[str] = None, third: Optional[str] = None):
+        self.first = first
+        self.second = second
+        self.third = third
     
     def __getitem__(self, index):
-        return self._bases[index]
+        return (self.first, self.second, self.third)[index]
         
     def __setitem__(self, index, value):
-        self._bases[index] = value
+        setattr(self, self.__slots__[index], value)
         
+    @property
+    def bits(self) -> int:
+        """Occupancy as a 3-bit mask: 1 = first, 2 = second, 4 = third"""
+        return (1 if self.first else 0) | (2 if self.second else 0) | (4 if self.third else 0)
+
     def to_list(self) -> List[Optional[str]]:
-        return self._bases.copy()
+        return [self.first, self.second, self.third]
     
     @classmethod
     def from_list(cls, bases: List[Optional[str]]) -> 'BaseState':
-        state = cls()
-        for i, runner in enumerate(bases[:3]):
-            state._bases[i] = runner
-        return state
+        return cls(*bases[:3])
+
+    def as_tuple(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        return (self.first, self.second, self.third)
+
+    @classmethod
+    def from_tuple(cls, bases: Tuple[Optional[str], Optional[str], Optional[str]]) -> 'BaseState':
+        return cls(*bases)
         
     def format(self) -> str:
         state_parts = []
         base_names = ['first', 'second', 'third']
-        for i, runner in enumerate(self._bases):
+        for i, runner in enumerate(self.to_list()):
             if runner:
                 state_parts.append(f"{runner} on {base_names[i]}")
         return ', '.join(state_parts) if state_parts else "Bases empty"
 
 class BaseRunningManager:
     """Manages all base running logic and state updates"""
+
+    # Pre-drawn uniforms for the per-play coin flips, seedable through calculations.rng.seed
+    _uniforms = UniformBuffer()
     
     @staticmethod
-    def determine_advancement(play_type: str, base_state: BaseState, outs: int) -> Tuple[Dict[str, bool], List[str]]:
+    def determine_advancement(play_type: Union[str, PlayKind], base_state: BaseState, outs: int) -> Tuple[Dict[str, bool], List[str]]:
         """
-        Determine how runners should advance based on the play type.
+        Determine how runners should advance based on the play type, given as
+        text or as an already classified PlayKind.
         Returns (advancement_dict, scored_runners).
         """
         
@@ -73,15 +140,15 @@ class BaseRunningManager:
         }
         scored_runners = []
         
-        play_type = play_type.lower()
+        kind = play_type if isinstance(play_type, PlayKind) else classify_play(play_type)
         runners = base_state.to_list()
 
-        if 'hits a home run' in play_type:
+        if kind == PlayKind.HOME_RUN:
             scored_runners.extend([runner for runner in runners if runner])
 
             advancement["score_run"] = True
 
-        elif 'triples' in play_type:
+        elif kind == PlayKind.TRIPLE:
             if base_state.third:
                 scored_runners.append(base_state.third)
             if base_state.second:
@@ -90,7 +157,7 @@ class BaseRunningManager:
                 scored_runners.append(base_state.first)
             advancement["advance_third"] = True
 
-        elif 'doubles' in play_type:
+        elif kind == PlayKind.DOUBLE:
 
             if base_state.third:
                 scored_runners.append(base_state.third)
@@ -100,17 +167,21 @@ class BaseRunningManager:
                 advancement["advance_third"] = True
             advancement["advance_second"] = True
 
-        elif 'singles' in play_type:
+        elif kind == PlayKind.SINGLE:
 
             if base_state.third:
                 scored_runners.append(base_state.third)
             elif base_state.second:
-                random.choice([lambda: scored_runners.append(base_state.second), lambda: advancement.update({"advance_third": True})])()
+                # Coin flip: the runner from second either scores or holds at third
+                if BaseRunningManager._uniforms.next() < 0.5:
+                    scored_runners.append(base_state.second)
+                else:
+                    advancement["advance_third"] = True
             if base_state.first:
                 advancement["advance_second"] = True
             advancement["advance_first"] = True
 
-        elif 'walk' in play_type:
+        elif kind == PlayKind.WALK:
             # Force advancement only
             if base_state.third and base_state.second and base_state.first:
                 scored_runners.append(base_state.third)
@@ -120,15 +191,30 @@ class BaseRunningManager:
                 advancement["advance_second"] = True
             advancement["advance_first"] = True
 
-        elif 'grounds out' in play_type:
+        elif kind == PlayKind.GROUNDOUT:
             pass
 
-        elif any(out_type in play_type for out_type in ['flies out', 'flyout', 'fly out']):
+        elif kind == PlayKind.FLYOUT:
             if base_state.third and outs < 2:
                 scored_runners.append(base_state.third)
         
         return advancement, scored_runners
 
+    @staticmethod
+    def advance_runners(kind: PlayKind, base_state: BaseState, batter_name: str) -> Tuple[BaseState, List[str]]:
+        """
+        Table-driven determine_advancement followed by update_base_state for
+        the kinds in RUNNER_MOVES. Returns (new_state, scored_runners).
+        """
+        state = base_state.bits
+        moves = RUNNER_MOVES[kind][state]
+        if kind == PlayKind.SINGLE and state & 6 == 2 and BaseRunningManager._uniforms.next() < 0.5:
+            moves = SINGLE_RUNNER_SCORES_MOVES[state]
+        new_sources, scored_sources = moves
+        runners = (base_state.first, base_state.second, base_state.third, batter_name)
+        new_state = BaseState(*(None if source is None else runners[source] for source in new_sources))
+        return new_state, [runners[source] for source in scored_sources]
+
     @staticmethod
     def update_base_state(
         current_state: BaseState,
@@ -137,69 +223,60 @@ class BaseRunningManager:
         scored_runners: List[str]
     ) -> BaseState:
         """Update base state based on runner advancement."""
-        new_state = BaseState()
-        
-        base_list = current_state.to_list()
-        
-        runners = current_state.to_list()
-        runners = [runner if runner not in scored_runners else None for runner in runners]
-        
-        current_state = BaseState.from_list(runners)
-        
+        bases = current_state.as_tuple()
+
         if not any(advancement.values()):
-            new_state._bases = base_list
-            return new_state
+            return BaseState.from_tuple(bases)
 
-        if advancement["advance_first"]:
-            if current_state.third:
-                scored_runners.append(current_state.third)
-            new_state.third = current_state.second
-            new_state.second = current_state.first
-            new_state.first = batter_name
+        first, second, third = bases
+        if scored_runners:
+            scored = set(scored_runners)
+            first, second, third = (None if runner in scored else runner for runner in bases)
 
+        if advancement["advance_first"]:
+            if third:
+                scored_runners.append(third)
+            return BaseState.from_tuple((batter_name, first, second))
 
         elif advancement["advance_second"]:
-            if current_state.third:
-                scored_runners.append(current_state.third)
-            if current_state.second:
-                scored_runners.append(current_state.second)
-            new_state.third = current_state.first
-            new_state.second = batter_name
-            if current_state.third:
-                scored_runners.append(current_state.third)
-
+            if third:
+                scored_runners.append(third)
+            if second:
+                scored_runners.append(second)
+            if third:
+                scored_runners.append(third)
+            return BaseState.from_tuple((None, batter_name, first))
 
         elif advancement["advance_third"]:
-            scored_runners.extend([r for r in runners if r])
-            new_state.third = batter_name
-            scored_runners.extend([r for r in base_list if r])
-
+            scored_runners.extend(r for r in (first, second, third) if r)
+            scored_runners.extend(r for r in bases if r)
+            return BaseState.from_tuple((None, None, batter_name))
 
         elif advancement["score_run"]:
-            scored_runners.extend([r for r in runners if r])
+            scored_runners.extend(r for r in (first, second, third) if r)
             scored_runners.append(batter_name)
 
-            
-        return new_state
+        return BaseState()
 
     @staticmethod
     def process_out(
         current_state: BaseState,
-        play_type: str,
+        play_type: Union[str, PlayKind],
         fielder_position: str,
         outs: int
     ) -> Tuple[BaseState, List[str]]:
         """Process base running on outs (groundout, flyout, etc)"""
         scored_runners = []
         new_state = BaseState.from_list(current_state.to_list())
+        kind = play_type if isinstance(play_type, PlayKind) else classify_play(play_type)
 
-        if 'flyout' in play_type or 'flies out' in play_type:
+        if kind == PlayKind.FLYOUT:
             if outs < 2:
                 if current_state.third and fielder_position in ['LF', 'CF', 'RF']:
                     scored_runners.append(current_state.third)
                     new_state.third = None
 
-        elif 'groundout' in play_type or 'grounds out' in play_type:
+        elif kind == PlayKind.GROUNDOUT:
             if current_state.third:
                 scored_runners.append(current_state.third)
                 new_state.third = None
@@ -2,45 +2,39 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 from manager.player_manager import Player
 from data.data_loader import TeamDataLoader
+import numpy as np
 
-@dataclass(frozen=True, eq=True)
+# Stat that picks each batting order slot: leadoff OBP, 2-hole OPS, 3-hole AVG, cleanup OPS, 5-hole SLG, then OPS
+LINEUP_SLOT_METRICS = ('obp', 'ops', 'avg', 'ops', 'slg', 'ops', 'ops', 'ops', 'ops')
+
+@dataclass(frozen=True, eq=True, slots=True)
 class BatterProfile:
     """Represents a batter's key characteristics for lineup optimization"""
     player_id: int
     name: str
     position: str
-    stats: Dict[str, any]  
+    obp: float = 0.320
+    slg: float = 0.400
+    hr: int = 3
+    hits: int = 110
+    rbi: int = 20
+    avg: float = 0.250
+    ops: float = 0.720
     
     def __hash__(self):
         return hash((self.player_id, self.name, self.position))
-    
-    @property
-    def obp(self) -> float:
-        return float(self.stats.get('obp', 0.320))
-        
-    @property
-    def slg(self) -> float:
-        return float(self.stats.get('slg', 0.400))
-        
-    @property
-    def hr(self) -> int:
-        return int(self.stats.get('hr', 3))
-    
-    @property
-    def hits(self) -> int:
-        return int(self.stats.get('hits', 110))
-        
-    @property
-    def rbi(self) -> int:
-        return int(self.stats.get('rbi', 20))
-        
-    @property
-    def avg(self) -> float:
-        return float(self.stats.get('avg', 0.250))
-    
-    @property
-    def ops(self) -> float:
-        return float(self.stats.get('ops', 0.720))
+
+def _select_lineup_slots(metrics: Dict[str, np.ndarray]) -> List[int]:
+    """Return the row index chosen for each batting order slot"""
+    # Slot x player score matrix; a chosen player's column is knocked out for later slots
+    scores = np.stack([metrics[metric] for metric in LINEUP_SLOT_METRICS])
+    chosen = []
+    for slot in range(len(LINEUP_SLOT_METRICS)):
+        # Each slot takes the best remaining batter by its metric; argmax keeps max()'s first-wins ties
+        idx = int(np.argmax(scores[slot]))
+        scores[:, idx] = -np.inf
+        chosen.append(idx)
+    return chosen
 
 class LineupOptimizer:
     """Optimizes batting order based on player statistics and historical baseball strategy"""
@@ -50,14 +44,26 @@ class LineupOptimizer:
 
     def _create_batter_profile(self, player: Player) -> Optional[BatterProfile]:
         """Create BatterProfile from Player object"""
+        stats = player.batting_stats
+        if stats is None:
+            stats = {}
+        elif not isinstance(stats, dict):
+            stats = stats.to_dict()
         try:
             return BatterProfile(
                 player_id=player.id,
                 name=player.name,
                 position=player.position,
-                stats=player.batting_stats.to_dict() if player.batting_stats else {}
+                obp=float(stats.get('obp', 0.320)),
+                slg=float(stats.get('slg', 0.400)),
+                hr=int(stats.get('hr', 3)),
+                hits=int(stats.get('hits', 110)),
+                rbi=int(stats.get('rbi', 20)),
+                avg=float(stats.get('avg', 0.250)),
+                ops=float(stats.get('ops', 0.720))
             )
-        except Exception as e:
+        except (TypeError, ValueError):
+            # Unparseable stat values leave the player out of the optimized order
             return None
 
     def optimize_lineup(self, players: List[Player]) -> List[Player]:
@@ -75,39 +81,20 @@ class LineupOptimizer:
                 
                 return position_players  
                 
-            in_lineup = []
-            available_profiles = profiles_with_players.copy()
-            
-            leadoff_idx = max(range(len(available_profiles)), 
-                            key=lambda i: available_profiles[i][0].obp)
-            in_lineup.append(available_profiles.pop(leadoff_idx))
-            
-            h2_idx = max(range(len(available_profiles)), 
-                        key=lambda i: available_profiles[i][0].ops)
-            in_lineup.append(available_profiles.pop(h2_idx))
-            
-            h3_idx = max(range(len(available_profiles)), 
-                        key=lambda i: available_profiles[i][0].avg)
-            in_lineup.append(available_profiles.pop(h3_idx))
-            
-            h4_idx = max(range(len(available_profiles)), 
-                        key=lambda i: available_profiles[i][0].ops)
-            in_lineup.append(available_profiles.pop(h4_idx))
-            
-            h5_idx = max(range(len(available_profiles)), 
-                        key=lambda i: available_profiles[i][0].slg)
-            in_lineup.append(available_profiles.pop(h5_idx))
+            n = len(profiles_with_players)
+            metrics = {
+                name: np.fromiter((getattr(profile, name) for profile, _ in profiles_with_players),
+                                  dtype=np.float64, count=n)
+                for name in set(LINEUP_SLOT_METRICS)
+            }
             
-            while available_profiles and len(in_lineup) < 9:
-                next_idx = max(range(len(available_profiles)), 
-                             key=lambda i: available_profiles[i][0].ops)
-                in_lineup.append(available_profiles.pop(next_idx))
+            in_lineup = [profiles_with_players[idx][1] for idx in _select_lineup_slots(metrics)]
             
-            return [player for _, player in in_lineup]
+            return in_lineup
                 
         except Exception as e:
             return position_players  
-        
+
     def _create_default_lineup(self) -> List[Dict]:
         """Create a default lineup"""
         return [
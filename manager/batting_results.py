@@ -1,6 +1,20 @@
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
+# float_format only sees float cells, so a bound str.format does the job of a lambda
+BATTER_TABLE_FORMAT = '{:.3f}'.format
+PITCHER_TABLE_FORMAT = '{:.2f}'.format
+
+def render_stat_table(df, float_format) -> str:
+    """Render a stat table to the HTML sent with each play"""
+    return df.to_html(
+        classes=['dataframe'],
+        border=0,
+        float_format=float_format,
+        justify='right',
+        na_rep='-'
+    )
+
 @dataclass
 class AtBatResult:
     final_pitch: Optional[str] = None
@@ -24,6 +38,9 @@ class AtBatResult:
     error_description: Optional[str] = None
     batter_df: Any = None
     pitcher_df: Any = None
+    # Pre-rendered HTML for the tables above, when the caller renders each matchup once
+    batter_table_html: Optional[str] = None
+    pitcher_table_html: Optional[str] = None
         
     def _format_base_running(self) -> str:
         """Format base running results"""
@@ -65,24 +82,16 @@ class AtBatResult:
             
         }
         
-        if self.batter_df is not None:
-            result['batter_df'] = self.batter_df.to_html(
-                classes=['dataframe'],
-                border=0,
-                float_format=lambda x: '{:.3f}'.format(x) if isinstance(x, float) else x,
-                justify='right',
-                na_rep='-'
-            )
-            
-        if self.pitcher_df is not None:
-            result['pitcher_df'] = self.pitcher_df.to_html(
-                classes=['dataframe'],
-                border=0,
-                float_format=lambda x: '{:.2f}'.format(x) if isinstance(x, float) else x,
-                justify='right',
-                na_rep='-'
-            )
-            
+        if self.batter_table_html is not None:
+            result['batter_df'] = self.batter_table_html
+        elif self.batter_df is not None:
+            result['batter_df'] = render_stat_table(self.batter_df, BATTER_TABLE_FORMAT)
+
+        if self.pitcher_table_html is not None:
+            result['pitcher_df'] = self.pitcher_table_html
+        elif self.pitcher_df is not None:
+            result['pitcher_df'] = render_stat_table(self.pitcher_df, PITCHER_TABLE_FORMAT)
+
         return result
     
 
@@ -2,11 +2,26 @@ from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from constants import PITCH_CODES
 
+PITCH_BALL, PITCH_STRIKE, PITCH_OTHER = 0, 1, 2
+
+def _pitch_kind(hit_type: str) -> int:
+    """Classify a pitch result as a ball, a strike (including fouls) or neither"""
+    result = hit_type.lower()
+    if 'ball' in result:
+        return PITCH_BALL
+    if 'strike' in result or 'foul' in result:
+        return PITCH_STRIKE
+    return PITCH_OTHER
+
 @dataclass
 class PitchResult:
     pitch_type: str
     pitch_velocity: float
     hit_type: str
+
+    def __post_init__(self):
+        # Plain attribute rather than a field so asdict()/to_dict() output is unchanged
+        self._kind = _pitch_kind(self.hit_type)
     
     def to_dict(self) -> Dict:
         """Convert PitchResult to a frontend-friendly format"""
@@ -44,17 +59,16 @@ class PitchSequenceManager:
         self.sequence.append(pitch_result)
         self.pitch_count += 1
         
-        result = pitch_result.hit_type.lower()
-        if 'ball' in result:
+        kind = pitch_result._kind
+        if kind == PITCH_BALL:
             self.balls += 1
-        elif 'strike' in result or 'foul' in result:
+        elif kind == PITCH_STRIKE:
             self.strikes += 1
                 
     def get_pitch_codes(self) -> List[str]:
         """Get list of pitch type codes in sequence"""
-        pitch_codes = [p.pitch_type for p in self.sequence]
-        pitch_name = [PITCH_CODES.get(code, code) for code in pitch_codes]
-        return pitch_name
+        lookup = PITCH_CODES.get
+        return [lookup(p.pitch_type, p.pitch_type) for p in self.sequence]
         
     def get_balls_strikes(self) -> Tuple[int, int]:
         """Get the current count of balls and strikes"""
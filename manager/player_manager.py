@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
 @dataclass
@@ -10,6 +11,7 @@ class Player:
     year: int
     batting_stats: Optional[Dict]
     pitching_stats: Optional[Dict]
+    __slots__ = ('id', 'name', 'position', 'year', '_batting_stats', '_pitching_stats', '_stat_dicts', '_player_view')
     
     def __init__(self, id, name, position, year, batting_stats, pitching_stats):
         self.id = id
@@ -18,6 +20,9 @@ class Player:
         self.year = year
         self._batting_stats = batting_stats
         self._pitching_stats = pitching_stats
+        # Plain-dict stats whose keys are readable as attributes, batting first
+        self._stat_dicts = tuple(stats for stats in (batting_stats, pitching_stats) if isinstance(stats, dict) and stats)
+        self._player_view = None
     
     @property
     def batting_stats(self) -> Optional[Dict]:
@@ -30,24 +35,25 @@ class Player:
         return self._pitching_stats
     
     def __getattr__(self, item):
-        """Custom attribute access that avoids recursion"""
-        if self._batting_stats and item in self._batting_stats:
-            return self._batting_stats[item]
-        if self._pitching_stats and item in self._pitching_stats:
-            return self._pitching_stats[item]
-        if item == 'get':
-            return lambda key, default=None: getattr(self, key, default)
+        """Fall back to stat dict keys for attributes the slots don't cover"""
+        if item not in Player.__slots__:
+            for stats in self._stat_dicts:
+                if item in stats:
+                    return stats[item]
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
 
     def get(self, key, default=None):
         """Implement dictionary-like get method for compatibility"""
         if key == 'player':
-            return {
-                'fullName': self.name,
-                'stats': self.stats,
-                'id': self.id,
-                'position': self.position
-            }
+            # Built once and handed out read-only; none of these fields change after construction
+            if self._player_view is None:
+                self._player_view = {
+                    'fullName': self.name,
+                    'stats': self.stats,
+                    'id': self.id,
+                    'position': self.position
+                }
+            return MappingProxyType(self._player_view)
         return getattr(self, key, default)    
     @property
     def stats(self):
@@ -1,8 +1,27 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Union
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Union
 from manager.player_manager import Player
 from stats.base_stats import PitchArsenal
 
+# Shared fallback for non-dict arsenals; callers only read it (it feeds the pitch prompt)
+_DEFAULT_ARSENAL = PitchArsenal.get_default_arsenal()
+
+def _ensure_player(data: Union[Player, Dict], year: int) -> Player:
+    """Wrap a lineup dict entry in a Player, passing Player entries through"""
+    if isinstance(data, Player):
+        return data
+    player_data = data.get('player', {})
+    return Player(
+        id=player_data.get('id'),
+        name=player_data.get('fullName'),
+        position=player_data.get('position'),
+        year=year,
+        batting_stats=player_data.get('stats'),
+        pitching_stats=None
+    )
+
 @dataclass
 class TeamIdentifier:
     """Uniquely identifies a team including its year"""
@@ -25,9 +44,14 @@ class TeamRoster:
         self.year = year
         self._current_batter_index = _current_batter_index
         self.roster = roster
+        self._lineup_positions = MappingProxyType({player.name: player.position for player in roster})
         self.starting_pitcher = starting_pitcher
         self.pitch_arsenal = pitch_arsenal
+        # Wrap any dict entries once here so lookups during the game never build a Player
+        if _batter_lineup and not all(isinstance(batter, Player) for batter in _batter_lineup):
+            _batter_lineup = [_ensure_player(batter, year) for batter in _batter_lineup]
         self._batter_lineup = _batter_lineup 
+        self._lineup_len = len(_batter_lineup) if _batter_lineup else 0
         self._defense = _defense
 
     def __len__(self):
@@ -42,50 +66,24 @@ class TeamRoster:
         
         return self.defense
     
-    def get_pitch_arsenal(self) -> Dict:
-        """Get pitcher's arsenal with validation"""
+    @cached_property
+    def pitch_arsenal_normalized(self) -> Dict:
+        """Pitcher's arsenal validated once; the arsenal does not change mid-game"""
         if not self.pitch_arsenal:
             return PitchArsenal.get_default_arsenal()
             
         if isinstance(self.pitch_arsenal, dict):
             return self.pitch_arsenal
             
-        return {
-            'pitches': {
-                'FF': {
-                    'code': 'FF',
-                    'name': 'Four-Seam Fastball', 
-                    'percentage': 50.0,
-                    'avg_speed': 93.5
-                },
-                'SL': {
-                    'code': 'SL',
-                    'name': 'Slider',
-                    'percentage': 20.0,
-                    'avg_speed': 85.0
-                },
-                'CH': {
-                    'code': 'CH', 
-                    'name': 'Changeup',
-                    'percentage': 15.0,
-                    'avg_speed': 83.0
-                },
-                'CU': {
-                    'code': 'CU',
-                    'name': 'Curveball', 
-                    'percentage': 15.0,
-                    'avg_speed': 78.0
-                }
-            },
-            'primary_pitch': 'FF'
-        }
-
-    def get_lineup_positions(self) -> Dict[str, str]:
+        return _DEFAULT_ARSENAL
+
+    def get_pitch_arsenal(self) -> Dict:
+        """Get pitcher's arsenal with validation"""
+        return self.pitch_arsenal_normalized
+
+    def get_lineup_positions(self) -> Mapping[str, str]:
         """Get defensive positions for lineup"""
-        return {
-            player.name: player.position
-            for player in self.roster
-        }
+        return self._lineup_positions
         
     @property
     def current_batter(self) -> Player:
@@ -98,7 +96,8 @@ class TeamRoster:
         """Move to next batter in lineup"""
         if not self._batter_lineup:
             raise ValueError("No players in lineup")
-        self._current_batter_index = (self._current_batter_index + 1) % len(self._batter_lineup)
+        index = self._current_batter_index + 1
+        self._current_batter_index = 0 if index >= self._lineup_len else index
         return self.current_batter
     
     def get_stats(self, player: Player, stat_type: str) -> Dict:
@@ -117,7 +116,6 @@ class TeamManager:
     away_team: TeamRoster
     home_team: TeamRoster
     _away_is_batting: bool = True
-    _current_batter_index: int = field(default=0, init=False)
         
     @property
     def batting_team(self) -> TeamRoster:
@@ -134,33 +132,21 @@ class TeamManager:
         return self.batting_team._batter_lineup
 
     def get_current_batter(self) -> Player:
-        batter = self.batting_team._batter_lineup[self._current_batter_index]
-        return self._ensure_player(batter)
+        # Each roster owns its place in the order, so the batting team is the only source of truth
+        team = self.batting_team
+        return team._batter_lineup[team._current_batter_index]
         
-    def _ensure_player(self, data: Union[Player, Dict]) -> Player:
-        if isinstance(data, Player):
-            return data
-        player_data = data.get('player', {})
-        return Player(
-            id=player_data.get('id'),
-            name=player_data.get('fullName'),
-            position=player_data.get('position'),
-            year=self.batting_team.year,
-            batting_stats=player_data.get('stats'),
-            pitching_stats=None
-        )
-
     def get_current_pitcher(self) -> Player:
         """Single source of truth for current pitcher"""
         return self.fielding_team.starting_pitcher
 
     def advance_batter(self) -> Player:
         """Move to next batter with validation"""
-        lineup = self.batting_team._batter_lineup
-        if not lineup:
+        team = self.batting_team
+        if not team._batter_lineup:
             raise ValueError("No batting lineup available")
 
-        self._current_batter_index = (self._current_batter_index + 1) % len(lineup)
+        team.advance_batter()
         return self.get_current_batter()
 
     def get_defensive_positions(self) -> List[Dict]:
@@ -169,17 +155,7 @@ class TeamManager:
 
     def get_current_pitch_arsenal(self) -> Dict:
         """Get current pitcher's arsenal"""
-            
-        arsenal = self.fielding_team.get_pitch_arsenal()
-       
-        return arsenal
+        return self.fielding_team.pitch_arsenal_normalized
 
     def switch_teams(self) -> None:
-        if self._away_is_batting:
-            self.away_team._current_batter_index = self._current_batter_index
-            self._away_is_batting = False
-            self._current_batter_index = self.home_team._current_batter_index
-        else:
-            self.home_team._current_batter_index = self._current_batter_index
-            self._away_is_batting = True
-            self._current_batter_index = self.away_team._current_batter_index
\ No newline at end of file
+        self._away_is_batting = not self._away_is_batting
@@ -1,6 +1,74 @@
 from typing import Dict
 from constants import RAW_PITCH_CODES
 
+# Rendered once in the same set notation the prompt has always shown
+_PITCH_CODE_CHOICES = str(set(RAW_PITCH_CODES))
+
+_FALLBACK_ARSENAL = {
+    'pitches': {
+        'FF': {
+            'code': 'FF',
+            'name': 'Four-Seam Fastball',
+            'percentage': 50.0,
+            'avg_speed': 93.5
+        },
+        'SL': {
+            'code': 'SL', 
+            'name': 'Slider',
+            'percentage': 20.0,
+            'avg_speed': 85.0
+        }
+    },
+    'primary_pitch': 'FF'
+}
+
+
+def _arsenal_text(arsenal: Dict) -> str:
+    """Describe each pitch in the arsenal on one line"""
+    return " | ".join(
+        f"{pitch['name']} ({pitch['percentage']:.1f}%, {pitch['avg_speed']:.1f} mph)"
+        for pitch in arsenal.get('pitches', {}).values()
+    )
+
+_FALLBACK_ARSENAL_TEXT = _arsenal_text(_FALLBACK_ARSENAL)
+
+# The arsenal is the same dict for every pitch of an at-bat, so its text is memoized on identity
+_last_arsenal = (None, '')
+
+# Everything after the arsenal line is fixed, so it is rendered once at import
+_PROMPT_RULES = f"""
+   
+    Rules for generating your response:
+
+    - When considering a fielded out, sometimes choose a hit type instead. Not all hit balls are fielded out.
+    - Your rationale should ONLY discuss the batter/pitcher matchup and game situation
+    - Generate a logical pitch sequence that use the provided pitch arsenal, game situation, and choices the pitcher would make logically for the matchup.
+    - Strikeouts require 2 strikes, walks require 3 balls
+    - Return pitch codes only, not pitch names
+    - Do not specify fielding positions or hit locations
+    
+    Use ONLY this JSON format for your reply:
+    ```json
+    {{
+        "final_play":
+        {{  
+            "final_pitch": "One of {_PITCH_CODE_CHOICES}",
+            "final_result": "strikeout|walk|hit|fielded out",
+            "final_hit": "singles|doubles|triples|hits a home run",
+            "final_fielded_out": "grounds out|flys out|lines out",
+            "final_rationale": "Statistical analysis of the overall play result"
+        }},
+        "pitches": 
+        {{
+            "pitch1": {{
+                "play_result": "strike|ball",
+                "pitch_type": "One of {_PITCH_CODE_CHOICES}"
+            }}
+            Additional pitches following same format...
+        }}
+    }}
+    ```"""
+
     
 def create_pitch_prompt(context: Dict) -> str:
     batting_team_name = context.get("batting_team", "Batting Team")
@@ -18,31 +86,16 @@ def create_pitch_prompt(context: Dict) -> str:
     
     
    
+    global _last_arsenal
+    # One read of the shared pair, so a concurrent game can't swap it between the check and the use
+    last_arsenal, last_text = _last_arsenal
     if not arsenal or not isinstance(arsenal, dict):
-        arsenal = {
-            'pitches': {
-                'FF': {
-                    'code': 'FF',
-                    'name': 'Four-Seam Fastball',
-                    'percentage': 50.0,
-                    'avg_speed': 93.5
-                },
-                'SL': {
-                    'code': 'SL', 
-                    'name': 'Slider',
-                    'percentage': 20.0,
-                    'avg_speed': 85.0
-                }
-            },
-            'primary_pitch': 'FF'
-        }
-
-    arsenal_desc = []
-    for code, pitch in arsenal.get('pitches', {}).items():
-        arsenal_desc.append(f"{pitch['name']} ({pitch['percentage']:.1f}%, {pitch['avg_speed']:.1f} mph)")
-    
-    arsenal_text = " | ".join(arsenal_desc)
-    
+        arsenal_text = _FALLBACK_ARSENAL_TEXT
+    elif last_arsenal is arsenal:
+        arsenal_text = last_text
+    else:
+        arsenal_text = _arsenal_text(arsenal)
+        _last_arsenal = (arsenal, arsenal_text)
 
     prompt = f"""Simulate the final result of an at-bat between {batter_name} of the {batting_team_name} and {pitcher_name} of the {fielding_team_name}.
     This game is taking place between teams of different eras, so stats for the player have been normalized for the year {home_year}.
@@ -62,37 +115,6 @@ def create_pitch_prompt(context: Dict) -> str:
     Pitcher Stats: 
     Normalized Stats: {normalized_pitcher_stats}
     
-    - Pitch Arsenal: {arsenal_text}
-   
-    Rules for generating your response:
-
-    - When considering a fielded out, sometimes choose a hit type instead. Not all hit balls are fielded out.
-    - Your rationale should ONLY discuss the batter/pitcher matchup and game situation
-    - Generate a logical pitch sequence that use the provided pitch arsenal, game situation, and choices the pitcher would make logically for the matchup.
-    - Strikeouts require 2 strikes, walks require 3 balls
-    - Return pitch codes only, not pitch names
-    - Do not specify fielding positions or hit locations
-    
-    Use ONLY this JSON format for your reply:
-    ```json
-    {{
-        "final_play":
-        {{  
-            "final_pitch": "One of {RAW_PITCH_CODES}",
-            "final_result": "strikeout|walk|hit|fielded out",
-            "final_hit": "singles|doubles|triples|hits a home run",
-            "final_fielded_out": "grounds out|flys out|lines out",
-            "final_rationale": "Statistical analysis of the overall play result"
-        }},
-        "pitches": 
-        {{
-            "pitch1": {{
-                "play_result": "strike|ball",
-                "pitch_type": "One of {RAW_PITCH_CODES}"
-            }}
-            Additional pitches following same format...
-        }}
-    }}
-    ```"""
+    - Pitch Arsenal: {arsenal_text}"""
 
-    return prompt
\ No newline at end of file
+    return prompt + _PROMPT_RULES
\ No newline at end of file
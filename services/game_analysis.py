@@ -1,7 +1,23 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import List, Dict, Any
-from services.game_statistics_models import GamePlayer, GameAtBatStats, GamePitchingStats
+import hashlib
+from services.game_statistics_models import GamePlayer
 from prompts.analysis_prompt import game_analysis_prompt
+from data.response_cache import ResponseCache
+
+
+@cache
+def _llm_cache() -> ResponseCache:
+    """Persistent cache of LLM analyses, so replayed games skip the model call"""
+    return ResponseCache('.llm_cache.sqlite')
+
+
+def _prompt_key(client: Any, prompt: str) -> str:
+    """Stable key for a prompt sent to a given model"""
+    config = getattr(client, 'config', None)
+    model = f"{getattr(config, 'provider', '')}/{getattr(config, 'model', '')}"
+    return hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=16).hexdigest()
 
 @dataclass 
 class LLMGameAnalysis:
@@ -28,27 +44,20 @@ class LLMGameAnalysis:
         if not isinstance(player, GamePlayer):
             raise TypeError("player must be an instance of GamePlayer")
             
-        new_player = GamePlayer(
-            player_id=player.player_id,
-            name=player.name,
-            team=player.team,
-            position=player.position
-        )
-        
-        # Copy statistics if they exist
-        if player.batting_stats:
-            new_player.batting_stats = GameAtBatStats(**player.batting_stats.__dict__)
-        if player.pitching_stats:
-            new_player.pitching_stats = GamePitchingStats(**player.pitching_stats.__dict__)
-
-        self.players.append(new_player)
+        # The analysis only reads players at the end of a game, so no defensive copy is needed
+        self.players.append(player)
     
     def send_to_llm(self) -> str:
         """Send game analysis to LLM and return the response"""
         prompt = game_analysis_prompt(
             game_info=self.game_info.to_dict(),
-            player_data=[player.to_dict() for player in self.players]
+            player_data=f"[{', '.join(player.to_json() for player in self.players)}]"
         )
         
-        response = self.client.get_response(prompt)
+        key = _prompt_key(self.client, prompt)
+        response = _llm_cache().get(key)
+        if response is None:
+            response = self.client.get_response(prompt)
+            if response:
+                _llm_cache().set(key, response)
         return response
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional, TypeVar, Generic, Any
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Generic, Any
 from abc import ABC, abstractmethod
+import numpy as np
 from services.game_statistics_models import GameAtBatStats, GamePitchingStats, GamePlayer, AdvancedMetrics, PlayerPerformance
 
 
@@ -65,13 +66,116 @@ class PerformanceConfig:
         'walks': -1.5
     })
 
+    # Ordered keys and weight vectors derived once from the dicts above
+    batting_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    batting_w: np.ndarray = field(init=False, repr=False, compare=False)
+    pitching_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    pitching_w: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.batting_keys = tuple(self.batting_weights)
+        self.batting_w = np.array([self.batting_weights[k] for k in self.batting_keys], dtype=np.float64)
+        self.pitching_keys = tuple(self.pitching_weights)
+        self.pitching_w = np.array([self.pitching_weights[k] for k in self.pitching_keys], dtype=np.float64)
+
 class PerformanceManager:
     """Manages performance evaluation with advanced metrics"""
     
     def __init__(self, config: Optional[PerformanceConfig] = None):
         self.config = config or PerformanceConfig()
+        self._batting_pairs = tuple(zip(self.config.batting_keys, self.config.batting_w.tolist()))
+        self._pitching_pairs = tuple(zip(self.config.pitching_keys, self.config.pitching_w.tolist()))
+
+    @staticmethod
+    def _weighted_scores(stats: Sequence[Any], keys: tuple, weights: np.ndarray) -> np.ndarray:
+        """Score many stat lines at once as a (players x stats) matrix times the weight vector"""
+        mat = np.zeros((len(stats), len(keys)), dtype=np.float64)
+        for j, key in enumerate(keys):
+            mat[:, j] = [getattr(s, key, 0) for s in stats]
+        return mat @ weights
+
+    def evaluate_all_batting(self, players: Sequence[GamePlayer]) -> np.ndarray:
+        """Batting base scores for every player, 0 where there are no at-bats"""
+        active = [i for i, p in enumerate(players) if p.batting_stats is not None and p.batting_stats.at_bats != 0]
+        scores = np.zeros(len(players), dtype=np.float64)
+        if active:
+            try:
+                scores[active] = self._weighted_scores(
+                    [players[i].batting_stats for i in active], self.config.batting_keys, self.config.batting_w)
+            except (TypeError, ValueError):
+                scores[active] = [self.evaluate_batting(players[i].batting_stats)['base_score'] for i in active]
+        return scores
 
+    def evaluate_all_pitching(self, players: Sequence[GamePlayer]) -> np.ndarray:
+        """Pitching base scores for every player, 0 where no innings were pitched"""
+        active = [i for i, p in enumerate(players) if p.pitching_stats is not None and p.pitching_stats.innings_pitched != 0]
+        scores = np.zeros(len(players), dtype=np.float64)
+        if active:
+            try:
+                scores[active] = np.maximum(0.0, self._weighted_scores(
+                    [players[i].pitching_stats for i in active], self.config.pitching_keys, self.config.pitching_w))
+            except (TypeError, ValueError):
+                scores[active] = [self.evaluate_pitching(players[i].pitching_stats)['base_score'] for i in active]
+        return scores
+
+    def evaluate_all_pitch_velocities(self, players: Sequence[GamePlayer]) -> List[Optional[Dict[str, float]]]:
+        """Velocity avg/max/min for every pitcher with innings, reduced over one flat array"""
+        metrics = [None] * len(players)
+        active = [i for i, p in enumerate(players)
+                  if p.pitching_stats is not None and p.pitching_stats.innings_pitched > 0 and p.pitching_stats.pitch_velocity]
+        if not active:
+            return metrics
+        series = [players[i].pitching_stats.pitch_velocity for i in active]
+        counts = np.fromiter((len(velocities) for velocities in series), dtype=np.intp, count=len(series))
+        starts = np.zeros(len(series), dtype=np.intp)
+        np.cumsum(counts[:-1], out=starts[1:])
+        flat = np.concatenate(series).astype(np.float64, copy=False)
+        means = np.add.reduceat(flat, starts) / counts
+        maxima = np.maximum.reduceat(flat, starts)
+        minima = np.minimum.reduceat(flat, starts)
+        for j, i in enumerate(active):
+            metrics[i] = {'avg': float(means[j]), 'max': float(maxima[j]), 'min': float(minima[j])}
+        return metrics
     
+    # Highlight rules as tiers of (predicate, message) pairs; the first matching rule in each tier applies
+    _PITCHING_RULES = (
+        ((lambda s: s.hits_allowed == 0 and s.innings_pitched >= 9, lambda s: f"Threw a no-hitter over {s.innings_pitched} innings"),
+         (lambda s: s.hits_allowed == 0, lambda s: f"Allowed no hits in {s.innings_pitched} innings")),
+        ((lambda s: s.earned_runs == 0 and s.innings_pitched >= 9, lambda s: "Threw a complete game shutout"),
+         (lambda s: s.earned_runs == 0, lambda s: f"Pitched {s.innings_pitched} scoreless innings")),
+        # Strikeout milestones
+        ((lambda s: s.total_strikeouts >= 20, lambda s: f"Historic {s.total_strikeouts} strikeout performance"),
+         (lambda s: s.total_strikeouts >= 15, lambda s: f"Dominant {s.total_strikeouts} strikeout performance"),
+         (lambda s: s.total_strikeouts >= 10, lambda s: f"Recorded {s.total_strikeouts} strikeouts")),
+        # Walk and control highlights
+        ((lambda s: s.walks == 0 and s.innings_pitched >= 6, lambda s: f"Perfect control with no walks over {s.innings_pitched} innings"),),
+        # Pitch count efficiency
+        ((lambda s: s.pitches_thrown < 100 and s.innings_pitched >= 8, lambda s: f"Efficient outing with only {s.pitches_thrown} pitches"),),
+    )
+
+    _BATTING_RULES = (
+        ((lambda s: s.hits >= 4, lambda s: f"Outstanding {s.hits}-hit performance"),
+         (lambda s: s.hits >= 3, lambda s: f"Collected {s.hits} hits"),
+         (lambda s: s.hits == 2, lambda s: "Multi-hit game")),
+        # Extra base hits
+        ((lambda s: s.home_runs >= 2, lambda s: f"Smashed {s.home_runs} home runs"),
+         (lambda s: s.home_runs == 1, lambda s: "Hit a home run")),
+        ((lambda s: s.triples >= 1, lambda s: f"Hit {s.triples} triple{'s' if s.triples > 1 else ''}"),),
+        ((lambda s: s.doubles >= 3, lambda s: f"Extra-base machine with {s.doubles} doubles"),
+         (lambda s: s.doubles == 2, lambda s: "Hit two doubles")),
+        # RBI production
+        ((lambda s: s.rbis >= 4, lambda s: f"Drove in {s.rbis} runs"),
+         (lambda s: s.rbis >= 2, lambda s: f"Collected {s.rbis} RBI")),
+    )
+
+    @staticmethod
+    def _apply_rules(rules: tuple, stats: Any, highlights: List[str]) -> None:
+        for tier in rules:
+            for matches, message in tier:
+                if matches(stats):
+                    highlights.append(message(stats))
+                    break
+
     def generate_highlights(self, player: GamePlayer, 
                         batting_stats: Optional[GameAtBatStats], 
                         pitching_stats: Optional[GamePitchingStats]) -> PlayerPerformance:
@@ -79,61 +183,10 @@ class PerformanceManager:
         highlights = []
         
         if player.position == 'P' and pitching_stats:
-            if pitching_stats.hits_allowed == 0:
-                if pitching_stats.innings_pitched >= 9:
-                        highlights.append(f"Threw a no-hitter over {pitching_stats.innings_pitched} innings")
-                else:
-                    highlights.append(f"Allowed no hits in {pitching_stats.innings_pitched} innings")
-                    
-            if pitching_stats.earned_runs == 0:
-                if pitching_stats.innings_pitched >= 9:
-                    highlights.append(f"Threw a complete game shutout")
-                else:
-                    highlights.append(f"Pitched {pitching_stats.innings_pitched} scoreless innings")
-
-            # Strikeout milestones
-            if pitching_stats.total_strikeouts >= 20:
-                highlights.append(f"Historic {pitching_stats.total_strikeouts} strikeout performance")
-            elif pitching_stats.total_strikeouts >= 15:
-                highlights.append(f"Dominant {pitching_stats.total_strikeouts} strikeout performance")
-            elif pitching_stats.total_strikeouts >= 10:
-                highlights.append(f"Recorded {pitching_stats.total_strikeouts} strikeouts")
-
-            # Walk and control highlights
-            if pitching_stats.walks == 0 and pitching_stats.innings_pitched >= 6:
-                highlights.append(f"Perfect control with no walks over {pitching_stats.innings_pitched} innings")
-            
-            # Pitch count efficiency
-            if pitching_stats.pitches_thrown < 100 and pitching_stats.innings_pitched >= 8:
-                highlights.append(f"Efficient outing with only {pitching_stats.pitches_thrown} pitches")
+            self._apply_rules(self._PITCHING_RULES, pitching_stats, highlights)
             
         if batting_stats:
-            if batting_stats.hits >= 4:
-                highlights.append(f"Outstanding {batting_stats.hits}-hit performance")
-            elif batting_stats.hits >= 3:
-                highlights.append(f"Collected {batting_stats.hits} hits")
-            elif batting_stats.hits == 2:
-                highlights.append(f"Multi-hit game")
-
-            # Extra base hits
-            if batting_stats.home_runs >= 2:
-                highlights.append(f"Smashed {batting_stats.home_runs} home runs")
-            elif batting_stats.home_runs == 1:
-                highlights.append("Hit a home run")
-                
-            if batting_stats.triples >= 1:
-                highlights.append(f"Hit {batting_stats.triples} triple{'s' if batting_stats.triples > 1 else ''}")
-                
-            if batting_stats.doubles >= 3:
-                highlights.append(f"Extra-base machine with {batting_stats.doubles} doubles")
-            elif batting_stats.doubles == 2:
-                highlights.append("Hit two doubles")
-                
-            # RBI production    
-            if batting_stats.rbis >= 4:
-                highlights.append(f"Drove in {batting_stats.rbis} runs")
-            elif batting_stats.rbis >= 2:
-                highlights.append(f"Collected {batting_stats.rbis} RBI")
+            self._apply_rules(self._BATTING_RULES, batting_stats, highlights)
 
         return highlights
     
@@ -147,7 +200,7 @@ class PerformanceManager:
         try:    
             base_score = sum(
                 getattr(stats, stat, 0) * weight
-                for stat, weight in self.config.batting_weights.items()
+                for stat, weight in self._batting_pairs
             )
         except Exception as e:
             base_score = 0.0
@@ -167,7 +220,7 @@ class PerformanceManager:
         try:
             base_score = max(0.0, sum(
                 getattr(stats, stat, 0) * weight
-                for stat, weight in self.config.pitching_weights.items()
+                for stat, weight in self._pitching_pairs
             ))
         except Exception as e:
             base_score = 0.0
@@ -177,8 +230,20 @@ class PerformanceManager:
             'avg_pitch_velocity': stats.avg_pitch_velocity
         }
 
-    def evaluate_player(self, player: GamePlayer) -> Optional[PlayerPerformance]:
-        """Evaluate player with advanced metrics"""
+    def evaluate_all(self, players: Sequence[GamePlayer]) -> List[Optional[PlayerPerformance]]:
+        """Evaluate many players, scoring their stat lines in one vectorized pass"""
+        batting_scores = np.maximum(self.evaluate_all_batting(players), 0.0)
+        pitching_scores = self.evaluate_all_pitching(players)
+        velocity_metrics = self.evaluate_all_pitch_velocities(players)
+        return [
+            self.evaluate_player(player, float(batting_scores[i]), float(pitching_scores[i]), velocity_metrics[i])
+            for i, player in enumerate(players)
+        ]
+
+    def evaluate_player(self, player: GamePlayer, batting_score: Optional[float] = None,
+                        pitching_score: Optional[float] = None,
+                        pitch_velocity_metrics: Optional[Dict[str, float]] = None) -> Optional[PlayerPerformance]:
+        """Evaluate player with advanced metrics, optionally reusing precomputed base scores"""
         if not player:
             return None
             
@@ -187,33 +252,44 @@ class PerformanceManager:
         pitcher_score = None
         stats = {}
         highlights = []
-        
+        # Stats objects are kept as-is and only flattened by PlayerPerformance.to_dict
         if player.batting_stats:
-            batting_metrics = self.evaluate_batting(player.batting_stats)
+            stats['batting'] = player.batting_stats
+        if player.pitching_stats:
+            stats['pitching'] = player.pitching_stats
+        
+        if player.batting_stats and player.batting_stats.at_bats > 0:
+            if batting_score is None:
+                batting_metrics = self.evaluate_batting(player.batting_stats)
+            else:
+                batting_metrics = {'base_score': batting_score}
             batting_highlights = self.generate_highlights(player, player.batting_stats, None)
             score = max(0.0, batting_metrics['base_score'])
             
             if player.batting_stats.exit_velocity > 0:
                 advanced_metrics.exit_velocity_metrics = player.batting_stats.exit_velocity,
 
-            stats['batting'] = player.batting_stats.__dict__
             highlights.extend(batting_highlights)
             
-        if player.pitching_stats:
-            pitching_metrics = self.evaluate_pitching(player.pitching_stats)
+        if player.pitching_stats and player.pitching_stats.innings_pitched > 0:
+            if pitching_score is None:
+                pitching_metrics = self.evaluate_pitching(player.pitching_stats)
+            else:
+                pitching_metrics = {'base_score': pitching_score}
             pitching_highlights = self.generate_highlights(player, None, player.pitching_stats)
             pitcher_score = max(0.0, pitching_metrics['base_score'])
             
-            if player.pitching_stats.pitch_velocity:
-                advanced_metrics.pitch_velocity_metrics = {
-                    'avg': pitching_metrics['avg_pitch_velocity'],
-                    'max': max(player.pitching_stats.pitch_velocity),
-                    'min': min(player.pitching_stats.pitch_velocity)
-                }
-            stats['pitching'] = player.pitching_stats.__dict__
+            if pitch_velocity_metrics is not None:
+                advanced_metrics.pitch_velocity_metrics = pitch_velocity_metrics
+            elif player.pitching_stats.pitch_velocity:
+                advanced_metrics.pitch_velocity_metrics = player.pitching_stats.velocity_summary()
             highlights.extend(pitching_highlights)
+        elif player.pitching_stats:
+            # No innings recorded: still a pitcher for leader ranking, but nothing to score
+            pitcher_score = 0.0
 
-        return PlayerPerformance(
+        # Name comes from a validated GamePlayer and both scores are clamped at 0 above
+        return PlayerPerformance.new_trusted(
             name=player.name,
             team=player.team,
             score=score,
@@ -1,8 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Any
-import statistics
+from utils import fast_json
 
-@dataclass
+@dataclass(slots=True)
 class AdvancedMetrics:
     """Encapsulates advanced baseball metrics"""
 
@@ -17,7 +17,7 @@ class AdvancedMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GameAtBatStats:
     """Encapsulates batting-specific statistics"""
     hits: int = 0
@@ -48,11 +48,18 @@ class GameAtBatStats:
         """Calculate batting average"""
         return self.hits / self.at_bats if self.at_bats > 0 else 0.0
 
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in _BATTING_FIELDS}
+
     
   
     
-@dataclass
-class GamePitchingStats:
+class _PitchingTotals:
+    """Slot for the running velocity total, kept out of the dataclass fields so asdict() skips it"""
+    __slots__ = ('_velocity_sum',)
+
+@dataclass(slots=True)
+class GamePitchingStats(_PitchingTotals):
     """Encapsulates pitching-specific statistics"""
     innings_pitched: float = 0.0
     pitches_thrown: int = 0
@@ -64,6 +71,14 @@ class GamePitchingStats:
     walks: int = 0
     pitch_velocity: List[float] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Running total kept beside the raw series (still needed for max/min and to_dict)
+        self._velocity_sum = float(sum(self.pitch_velocity))
+
+    def add_pitch_velocity(self, velocity: float) -> None:
+        """Record one pitch velocity and fold it into the running total"""
+        self.pitch_velocity.append(velocity)
+        self._velocity_sum += velocity
     
     @property
     def era(self) -> float:
@@ -73,10 +88,34 @@ class GamePitchingStats:
     @property
     def avg_pitch_velocity(self) -> float:
         """Calculate average pitch velocity"""
-        return statistics.mean(self.pitch_velocity) if self.pitch_velocity else 0.0
+        count = len(self.pitch_velocity)
+        return self._velocity_sum / count if count else 0.0
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in _PITCHING_FIELDS}
+
+    def velocity_summary(self) -> Dict[str, float]:
+        """Average, max and min pitch velocity"""
+        velocities = self.pitch_velocity
+        if not velocities:
+            return {}
+        return {'avg': self.avg_pitch_velocity, 'max': max(velocities), 'min': min(velocities)}
+
+_PITCHER_POSITIONS = frozenset({'P'})
+
+# Field names resolved once so to_dict builds its output without reflecting per call
+_BATTING_FIELDS = tuple(f.name for f in fields(GameAtBatStats))
+_PITCHING_FIELDS = tuple(f.name for f in fields(GamePitchingStats))
 
-@dataclass
-class GamePlayer:
+# Stats classes behind each PlayerPerformance.stats key, for from_dict
+_STATS_TYPES = {'batting': GameAtBatStats, 'pitching': GamePitchingStats}
+
+class _PlayerValidation:
+    """Slot for the validation flag, kept out of the dataclass fields so asdict() skips it"""
+    __slots__ = ('_stats_dirty',)
+
+@dataclass(slots=True)
+class GamePlayer(_PlayerValidation):
     """Represents a player in a game with their statistics"""
     player_id: int
     name: str 
@@ -87,20 +126,21 @@ class GamePlayer:
 
     def __post_init__(self):
         """Initialize stats objects based on position and validate data"""
-        if not self.name:
-            raise ValueError("Player name is required")
-        if not self.team:
-            raise ValueError("Team name is required")
-        if not self.position:
+        # Set by the update methods and mark_stats_changed, cleared once to_dict validates
+        self._stats_dirty = True
+        if not (self.name and self.team and self.position):
+            if not self.name:
+                raise ValueError("Player name is required")
+            if not self.team:
+                raise ValueError("Team name is required")
             raise ValueError("Position is required")
 
-        if self.position == 'DH':
-            self.batting_stats = GameAtBatStats()
-        elif self.position == 'P':
+        if self.position in _PITCHER_POSITIONS:
             self.pitching_stats = GamePitchingStats()
             if self.batting_stats is None:
                 self.batting_stats = GameAtBatStats()
         else:
+            # DH and fielders alike start with a fresh batting line
             self.batting_stats = GameAtBatStats()
 
     @property
@@ -138,9 +178,11 @@ class GamePlayer:
 
     def to_dict(self) -> Dict:
         """Convert player and stats to dictionary with validation"""
-        errors = self.validate_stats()
-        if errors:
-            raise ValueError(f"Invalid statistics for player {self.name}: {'; '.join(errors)}")
+        if self._stats_dirty:
+            errors = self.validate_stats()
+            if errors:
+                raise ValueError(f"Invalid statistics for player {self.name}: {'; '.join(errors)}")
+            self._stats_dirty = False
 
         base_dict = {
             'player_id': self.player_id,
@@ -151,20 +193,28 @@ class GamePlayer:
         
         if self.batting_stats:
             base_dict.update({
-                'batting': self.batting_stats.__dict__,
+                'batting': self.batting_stats.to_dict(),
                 'avg': self.batting_stats.avg,
                 'exit_velocity': self.batting_stats.exit_velocity
             })
             
         if self.pitching_stats:
             base_dict.update({
-                'pitching': self.pitching_stats.__dict__,
+                'pitching': self.pitching_stats.to_dict(),
                 'era': self.pitching_stats.era,
                 'pitch_velocity': self.pitching_stats.pitch_velocity
             })
             
         return base_dict
 
+    def to_json(self) -> str:
+        """Serialize the validated to_dict() form straight to JSON text"""
+        return fast_json.dumps_str(self.to_dict())
+
+    def mark_stats_changed(self) -> None:
+        """Flag in-place stat updates so the next to_dict re-validates"""
+        self._stats_dirty = True
+
     def update_batting_stats(self, new_stats: GameAtBatStats) -> None:
         """Update batting statistics with validation"""
         if self.position == 'P' and self.batting_stats is None:
@@ -173,14 +223,16 @@ class GamePlayer:
             raise ValueError(f"Cannot update batting stats for player {self.name} with position {self.position}")
         else:
             self.batting_stats = new_stats
+        self._stats_dirty = True
 
     def update_pitching_stats(self, new_stats: GamePitchingStats) -> None:
         """Update pitching statistics with validation"""
         if self.position != 'P':
             raise ValueError(f"Cannot update pitching stats for non-pitcher {self.name}")
         self.pitching_stats = new_stats
+        self._stats_dirty = True
 
-@dataclass
+@dataclass(slots=True)
 class PlayerPerformance:
     """Represents a player's performance in a game with advanced metrics"""
     name: str
@@ -201,6 +253,23 @@ class PlayerPerformance:
         if self.pitcher_score is not None and self.pitcher_score < 0:
             raise ValueError("Pitcher score cannot be negative")
 
+    @classmethod
+    def new_trusted(cls, name: str, team: str, score: float, highlights: Optional[List[str]] = None,
+                    stats: Optional[Dict] = None, player_id: Optional[int] = None,
+                    pitcher_score: Optional[float] = None,
+                    advanced_metrics: Optional[AdvancedMetrics] = None) -> 'PlayerPerformance':
+        """Build from values the evaluator already sanitized, skipping __post_init__ validation"""
+        performance = object.__new__(cls)
+        performance.name = name
+        performance.team = team
+        performance.score = score
+        performance.highlights = highlights
+        performance.stats = stats
+        performance.player_id = player_id
+        performance.pitcher_score = pitcher_score
+        performance.advanced_metrics = advanced_metrics
+        return performance
+
     @property
     def player_team(self) -> str:
         """Extract player team from stats if available"""
@@ -217,7 +286,7 @@ class PlayerPerformance:
             "highlights": self.highlights if self.highlights else None,
             "player_id": self.player_id,
             "pitcher_score": float(self.pitcher_score) if self.pitcher_score is not None else None,
-            "stats": dict(self.stats) if self.stats else None  
+            "stats": {kind: stats.to_dict() for kind, stats in self.stats.items()} if self.stats else None  
         }
         if self.advanced_metrics:
             base_dict["advanced_metrics"] = self.advanced_metrics.to_dict()
@@ -235,4 +304,9 @@ class PlayerPerformance:
             AdvancedMetrics(**advanced_metrics_data)
             if advanced_metrics_data else None
         )
-        return cls(**data, advanced_metrics=advanced_metrics)
\ No newline at end of file
+        stats_data = data.pop('stats', None)
+        stats = (
+            {kind: _STATS_TYPES[kind](**values) for kind, values in stats_data.items()}
+            if stats_data else None
+        )
+        return cls(**data, stats=stats, advanced_metrics=advanced_metrics)
\ No newline at end of file
@@ -17,6 +17,16 @@ class GameSummary:
     def __post_init__(self):
         """Validate required game information"""
         self._validate_game_info()
+        # (winner, loser, winning_score, losing_score), resolved once from the validated score
+        self._outcome = self._resolve_outcome()
+
+    def _resolve_outcome(self) -> Tuple[Optional[str], Optional[str], Optional[int], Optional[int]]:
+        scores = list(self.final_score.items())
+        if scores[0][1] == scores[1][1]:
+            return None, None, None, None
+        winner = max(scores, key=lambda x: x[1])
+        loser = min(scores, key=lambda x: x[1])
+        return winner[0], loser[0], winner[1], loser[1]
 
     def _validate_game_info(self) -> None:
         """Validate completeness and correctness of game information"""
@@ -65,29 +75,19 @@ class GameSummary:
     
     @property
     def winner(self) -> Optional[str]:
-        scores = list(self.final_score.items())
-        if scores[0][1] == scores[1][1]:
-            return None
-        return max(scores, key=lambda x: x[1])[0]
+        return self._outcome[0]
 
     @property
     def loser(self) -> Optional[str]:
-        scores = list(self.final_score.items())
-        if scores[0][1] == scores[1][1]:
-            return None
-        return min(scores, key=lambda x: x[1])[0]
+        return self._outcome[1]
     
     @property
     def winning_score(self) -> Optional[int]:
-        if self.winner is None:
-            return None
-        return self.final_score[self.winner]
+        return self._outcome[2]
 
     @property
     def losing_score(self) -> Optional[int]:
-        if self.loser is None:
-            return None
-        return self.final_score[self.loser]
+        return self._outcome[3]
 
     
     def add_performance(self, performance: PlayerPerformance, is_pitcher: bool = False) -> None:
@@ -105,20 +105,23 @@ class GameSummary:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary with complete details"""
+        winner, loser, winning_score, losing_score = self._outcome
+        performance_to_dict = self._performance_to_dict
         return {
             "game_info": {
                 **self.game_info,
-                "winner": self.winner,
-                "loser": self.loser,
-                "winning_score": self.winning_score,
-                "losing_score": self.losing_score
+                "winner": winner,
+                "loser": loser,
+                "winning_score": winning_score,
+                "losing_score": losing_score
             },
-            "mvp": self._performance_to_dict(self.mvp) if self.mvp else None,
-            "top_pitcher": self._performance_to_dict(self.top_pitcher) if self.top_pitcher else None,
-            "notable_performances": [self._performance_to_dict(perf) for perf in self.notable_performances],
+            "mvp": performance_to_dict(self.mvp) if self.mvp else None,
+            "top_pitcher": performance_to_dict(self.top_pitcher) if self.top_pitcher else None,
+            "notable_performances": [performance_to_dict(perf) for perf in self.notable_performances],
         }
 
-    def _performance_to_dict(self, perf: PlayerPerformance) -> Dict:
+    @staticmethod
+    def _performance_to_dict(perf: PlayerPerformance) -> Dict:
         """Convert performance to dictionary with complete metrics"""
         return {
             "name": perf.name,
@@ -134,14 +137,14 @@ class GameStatsManager:
     """Main class for managing game statistics"""
     
     REQUIRED_FIELDS = {
-        'batting': ['batter_name', 'batter_id', 'batter_position', 'batting_team'],
-        'pitching': ['pitcher_name', 'pitcher_id', 'fielding_team']
+        'batting': ('batter_name', 'batter_id', 'batter_position', 'batting_team'),
+        'pitching': ('pitcher_name', 'pitcher_id', 'fielding_team')
     }
     
     def __init__(self, home_team: str, away_team: str, config: Optional[PerformanceConfig] = None):
         self.home_team = home_team
         self.away_team = away_team
-        self.players: Dict[str, GamePlayer] = {}
+        self.players: Dict[Tuple[str, str, str], GamePlayer] = {}
         self.game_highlights: List[str] = []
         self.performance_manager = PerformanceManager(config)
         self.batting_stats_tracker = BattingStatsTracker()
@@ -149,42 +152,34 @@ class GameStatsManager:
         self.client = None
     
     def get_game_leaders(self) -> Dict[str, PlayerPerformance]:
-        performances = []
-        pitcher_performances = []
+        # Leaders tracked in the same pass; ties keep the earlier player, as max/sorted did
+        notable = []
+        top_pitcher = None
         
-        for player in self.players.values():
-            perf = self.performance_manager.evaluate_player(player)
+        players = list(self.players.values())
+        for player, perf in zip(players, self.performance_manager.evaluate_all(players)):
             if not perf:
                 continue
 
+            # evaluate_player already attached this player's highlights to perf
             if player.position == 'P' and player.pitching_stats:
-                highlights = self.performance_manager.generate_highlights(
-                    player=player,
-                    batting_stats=None,
-                    pitching_stats=player.pitching_stats,
-                )
-                if highlights:
-                    perf.highlights = highlights  # Set highlights on performance
-                pitcher_performances.append(perf)
+                # evaluate_player always sets pitcher_score when there are pitching stats
+                if top_pitcher is None or perf.pitcher_score > top_pitcher.pitcher_score:
+                    top_pitcher = perf
             elif player.batting_stats:
-                highlights = self.performance_manager.generate_highlights(
-                    player=player,
-                    batting_stats=player.batting_stats,
-                    pitching_stats=None,
-                )
-                if highlights:
-                    perf.highlights = highlights  # Set highlights on performance
-                performances.append(perf)
+                if len(notable) < 3 or perf.score > notable[-1].score:
+                    slot = len(notable)
+                    while slot and perf.score > notable[slot - 1].score:
+                        slot -= 1
+                    notable.insert(slot, perf)
+                    del notable[3:]
                         
         result = {}
-        if performances:
-            result['mvp'] = max(performances, key=lambda x: x.score)
-            result['notable'] = sorted(performances, key=lambda x: x.score, reverse=True)[:3]
-        if pitcher_performances:
-            result['top_pitcher'] = max(
-                pitcher_performances, 
-                key=lambda x: x.pitcher_score if x.pitcher_score is not None else float('-inf')
-            )
+        if notable:
+            result['mvp'] = notable[0]
+            result['notable'] = notable
+        if top_pitcher is not None:
+            result['top_pitcher'] = top_pitcher
                 
         return result
 
@@ -192,13 +187,12 @@ class GameStatsManager:
         is_pitcher = play_data.get('position') == 'P'
         required = self.REQUIRED_FIELDS['pitching' if is_pitcher else 'batting']
         
-        missing = [field for field in required if not play_data.get(field)]
-        if missing:
-            raise ValueError(f"Missing required fields: {missing}")
+        for required_field in required:
+            if not play_data.get(required_field):
+                # Only build the full list once something is known to be missing
+                missing = [field for field in required if not play_data.get(field)]
+                raise ValueError(f"Missing required fields: {missing}")
     
-    def _get_player_key(self, name: str, team: str) -> str:
-            return f"{name}_{team}"
-
     def _get_or_create_player(self, play_data: Dict) -> GamePlayer:
         is_pitcher = play_data.get('position') == 'P'
         
@@ -213,9 +207,10 @@ class GameStatsManager:
             player_id = play_data.get('batter_id', 0)
             player_position = play_data.get('batter_position', '')
 
-        player_key = f"{player_name}_{team}_{player_position}"
+        player_key = (player_name, team, player_position)
         
-        if player_key not in self.players:
+        player = self.players.get(player_key)
+        if player is None:
             player = GamePlayer(
                 player_id=player_id,
                 name=player_name,
@@ -224,39 +219,33 @@ class GameStatsManager:
             )
             self.players[player_key] = player
             
-        return self.players[player_key]
+        return player
     
     def record_play(self, play_data: Dict) -> None:
+        # Swap 'position' in place for each side instead of copying play_data twice
+        had_position = 'position' in play_data
+        original_position = play_data.get('position')
+        # No except: validation errors reach the caller with their own type and traceback
         try:
             # First handle pitching stats
-            pitcher_data = {
-                **play_data,
-                'position': 'P'
-            }
-            self._validate_play_data(pitcher_data)
-            pitcher = self._get_or_create_player(pitcher_data)
-            pitcher_stats = self.pitching_stats_tracker.update_stats(
-                pitcher.pitching_stats,
-                play_data
-            )
-            pitcher.update_pitching_stats(pitcher_stats)
+            play_data['position'] = 'P'
+            self._validate_play_data(play_data)
+            pitcher = self._get_or_create_player(play_data)
+            self.pitching_stats_tracker.update_stats(pitcher.pitching_stats, play_data)
+            pitcher.mark_stats_changed()
     
             # Then handle batting stats separately
-            batter_data = {
-                **play_data,
-                'position': play_data.get('batter_position', '')
-            }
+            play_data['position'] = play_data.get('batter_position', '')
             
-            self._validate_play_data(batter_data)
-            batter = self._get_or_create_player(batter_data)
-            batter_stats = self.batting_stats_tracker.update_stats(
-                batter.batting_stats,
-                play_data
-            )
-            batter.update_batting_stats(batter_stats)
-    
-        except Exception as e:
-            raise ValueError(f"Error recording play: {str(e)}")
+            self._validate_play_data(play_data)
+            batter = self._get_or_create_player(play_data)
+            self.batting_stats_tracker.update_stats(batter.batting_stats, play_data)
+            batter.mark_stats_changed()
+        finally:
+            if had_position:
+                play_data['position'] = original_position
+            else:
+                del play_data['position']
 
     def determine_game_outcome(self, final_score: Dict[str, int]) -> Dict[str, Optional[str]]:
         """Determine game outcome with proper tie handling"""
@@ -1,11 +1,45 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 from services.game_statistics_models import GameAtBatStats, GamePitchingStats
 
+# Shared by both trackers; module globals skip the class attribute lookup on every play
+VALID_RESULTS = frozenset({'strikeout', 'walk', 'fielded out', 'hit'})
+VALID_HIT_TYPES = frozenset({'singles', 'doubles', 'triples', 'hits a home run'})
+VALID_OUT_TYPES = frozenset({'grounds out', 'flies out', 'lines out'})
+
+# Counter attributes bumped for each validated result string
+_PITCHING_RESULT_ATTRS = {
+    'strikeout': ('total_strikeouts', 'strikeouts'),
+    'walk': ('walks',),
+    'fielded out': ('fielded_out_hits',),
+}
+_BATTING_RESULT_ATTR = {'walk': 'walks', 'strikeout': 'strikeouts'}
+_HIT_ATTR = {
+    'singles': 'singles', 'single': 'singles',
+    'doubles': 'doubles', 'double': 'doubles',
+    'triples': 'triples', 'triple': 'triples',
+    'hits a home run': 'home_runs',
+}
+_OUT_ATTR = {'grounds out': 'groundouts', 'flies out': 'flyouts', 'lines out': 'lineouts'}
+
+def _unique_count(runners: List) -> int:
+    """Count distinct runners; plays score at most four, so compare instead of building a set"""
+    n = len(runners)
+    if n < 2:
+        return n
+    if n > 4:
+        return len(set(runners))
+    count = 1 + (runners[1] != runners[0])
+    if n > 2:
+        count += runners[2] not in runners[:2]
+    if n > 3:
+        count += runners[3] not in runners[:3]
+    return count
+
 class PitchingStatsTracker:
     """Handles tracking and updating pitching statistics with comprehensive validation"""
     
-    VALID_RESULTS = {'strikeout', 'walk', 'fielded out', 'hit'}
-    VALID_HIT_TYPES = {'singles', 'doubles', 'triples', 'hits a home run'}
+    VALID_RESULTS = VALID_RESULTS
+    VALID_HIT_TYPES = VALID_HIT_TYPES
     
     @staticmethod
     def validate_pitch_velocity(velocity: float) -> bool:
@@ -19,19 +53,25 @@ class PitchingStatsTracker:
         return decimal_part in (0.0, 0.1, 0.2)
 
     @staticmethod  
-    def update_stats(stats: Optional[GamePitchingStats], stats_details: Dict) -> Tuple[GamePitchingStats, List[str]]:
-        """Update pitching statistics with comprehensive validation"""
+    def update_stats(stats: Optional[GamePitchingStats], stats_details: Dict) -> None:
+        """Update pitching statistics in place with comprehensive validation"""
         if not stats:
             raise ValueError("Stats object must be initialized before updating")
             
+        # Read every play field once up front
+        get = stats_details.get
+        result = get('final_result', '')
+        pitch_velocity = get('final_pitch_velocity')
+        pitch_count = get('pitch_count', 0)
+        hit_result = get('final_hit', '')
+        scored_runners = get('scored_runners', [])
+        outs = get('outs', 0)
+        inning = get('inning')
+
         # Validate input data
-        result = stats_details.get('final_result', '')
-        if result and result not in PitchingStatsTracker.VALID_RESULTS:
+        if result and result not in VALID_RESULTS:
             raise ValueError(f"Invalid result: {result}")
             
-        pitch_velocity = stats_details.get('final_pitch_velocity')
-        pitch_count = stats_details.get('pitch_count', 0)
-        
         # Validate pitch count
         if pitch_count < 0:
             raise ValueError(f"Invalid pitch count: {pitch_count}")
@@ -40,51 +80,40 @@ class PitchingStatsTracker:
         if pitch_velocity is not None:
             if not PitchingStatsTracker.validate_pitch_velocity(pitch_velocity):
                 raise ValueError(f"Invalid pitch velocity: {pitch_velocity}")
-            stats.pitch_velocity.append(pitch_velocity)
+            stats.add_pitch_velocity(pitch_velocity)
             
         # Update pitch count
         stats.pitches_thrown += pitch_count
             
         # Handle results with validation
-        if result == 'strikeout':
-            stats.total_strikeouts += 1
-            stats.strikeouts += 1
-        elif result == 'walk':
-            stats.walks += 1
-        elif result == 'fielded out':
-            stats.fielded_out_hits += 1
+        for attr in _PITCHING_RESULT_ATTRS.get(result, ()):
+            setattr(stats, attr, getattr(stats, attr) + 1)
             
         # Handle hits with validation
-        hit_result = stats_details.get('final_hit', '')
-        if hit_result and hit_result not in PitchingStatsTracker.VALID_HIT_TYPES:
+        if hit_result and hit_result not in VALID_HIT_TYPES:
             raise ValueError(f"Invalid hit type: {hit_result}")
             
-        if hit_result in PitchingStatsTracker.VALID_HIT_TYPES:
+        if hit_result in VALID_HIT_TYPES:
             stats.hits_allowed += 1
             
         # Update earned runs with validation
-        scored_runners = stats_details.get('scored_runners', [])
-        if not isinstance(scored_runners, list):
-            raise ValueError("scored_runners must be a list")
-        stats.earned_runs += len(set(scored_runners))
+        if scored_runners:
+            if not isinstance(scored_runners, list):
+                raise ValueError("scored_runners must be a list")
+            stats.earned_runs += _unique_count(scored_runners)
             
-        outs = stats_details.get('outs', 0)
         if not isinstance(outs, int) or outs < 0 or outs > 3:
             raise ValueError(f"Invalid number of outs: {outs}")
             
-        if stats_details.get('inning') > stats.innings_pitched:
+        if inning > stats.innings_pitched:
             stats.innings_pitched += 1
-            
-                   
-      
-        return stats
     
 class BattingStatsTracker:
     """Handles tracking and updating batting statistics with enhanced validation"""
     
-    VALID_RESULTS = {'walk', 'strikeout', 'hit', 'fielded out'}
-    VALID_HIT_TYPES = {'singles', 'doubles', 'triples', 'hits a home run'}
-    VALID_OUT_TYPES = {'grounds out', 'flies out', 'lines out'}
+    VALID_RESULTS = VALID_RESULTS
+    VALID_HIT_TYPES = VALID_HIT_TYPES
+    VALID_OUT_TYPES = VALID_OUT_TYPES
 
     @staticmethod
     def validate_exit_velocity(velocity: float) -> bool:
@@ -92,73 +121,56 @@ class BattingStatsTracker:
         return 50 <= velocity <= 120
     
     @staticmethod
-    def update_stats(stats: Optional[GameAtBatStats], stats_details: Dict) -> Tuple[GameAtBatStats, List[str]]:
-        """Update batting statistics with comprehensive validation"""
+    def update_stats(stats: Optional[GameAtBatStats], stats_details: Dict) -> None:
+        """Update batting statistics in place with comprehensive validation"""
         if not stats:
             raise ValueError("Stats object must be initialized before updating")
         
+        # Fields needed on every play are read once; the result-specific ones go through the bound get
+        get = stats_details.get
+        result = get('final_result', '')
+        scored_runners = get('scored_runners', [])
+
         # Validate input data
-        result = stats_details.get('final_result', '')
-        if result and result not in BattingStatsTracker.VALID_RESULTS:
+        if result and result not in VALID_RESULTS:
             raise ValueError(f"Invalid result: {result}")
             
-        previous_hits = stats.hits  
-        hit_increment = 0
-         
         # Process result
-        if result == 'walk':
-            stats.walks += 1
-        elif result == 'strikeout':
-            stats.strikeouts += 1
+        attr = _BATTING_RESULT_ATTR.get(result)
+        if attr:
+            setattr(stats, attr, getattr(stats, attr) + 1)
             
         if result == 'hit':
-            hit_type = stats_details.get('final_hit', '')
-            if hit_type and hit_type not in BattingStatsTracker.VALID_HIT_TYPES:
+            hit_type = get('final_hit', '')
+            if hit_type and hit_type not in VALID_HIT_TYPES:
                 raise ValueError(f"Invalid hit type: {hit_type}")
             
         
-            if hit_type == 'singles' or hit_type == 'single':
-                hit_increment += 1
-                stats.singles += 1
-            elif hit_type == 'doubles' or hit_type == 'double':
-                hit_increment += 1
-                stats.doubles += 1
-            elif hit_type == 'triples' or hit_type == 'triple':
-                hit_increment += 1
-                stats.triples += 1
-            elif hit_type == 'hits a home run':
-                hit_increment += 1
-                stats.home_runs += 1
-
-            stats.hits += hit_increment
+            attr = _HIT_ATTR.get(hit_type)
+            if attr:
+                setattr(stats, attr, getattr(stats, attr) + 1)
+                stats.hits += 1
             
             
         # Handle outs with validation
         if result == 'fielded out':
-            out_type = stats_details.get('final_fielded_out', '')
-            if out_type and out_type not in BattingStatsTracker.VALID_OUT_TYPES:
+            out_type = get('final_fielded_out', '')
+            if out_type and out_type not in VALID_OUT_TYPES:
                 raise ValueError(f"Invalid out type: {out_type}")
                 
-            if out_type == 'grounds out':
-                stats.groundouts += 1
-            elif out_type == 'flies out':
-                stats.flyouts += 1
-            elif out_type == 'lines out':
-                stats.lineouts += 1
+            attr = _OUT_ATTR.get(out_type)
+            if attr:
+                setattr(stats, attr, getattr(stats, attr) + 1)
                 
         if result == 'hit' or result == 'fielded out':
-            exit_velocity = stats_details.get('final_exit_velocity')
+            exit_velocity = get('final_exit_velocity')
             if exit_velocity is not None:
                 if not BattingStatsTracker.validate_exit_velocity(exit_velocity):
                     raise ValueError(f"Invalid exit velocity: {exit_velocity}")
                 stats.exit_velocity = exit_velocity
             
         # Update RBIs with validation
-        scored_runners = stats_details.get('scored_runners', [])
         if scored_runners:
             if not isinstance(scored_runners, list):
                 raise ValueError("scored_runners must be a list")
-            unique_runners = list(set(scored_runners))
-            stats.rbis += len(unique_runners)
-            
-        return stats
\ No newline at end of file
+            stats.rbis += _unique_count(scored_runners)
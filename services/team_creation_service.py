@@ -6,8 +6,20 @@ from stats.base_stats import BattingStats, PitchingStats
 from typing import Dict, List, Optional
 from manager.batter_selection import LineupOptimizer
 from constants import REQUIRED_POSITIONS
+from collections import defaultdict, deque
+import copy
+import threading
+from cachetools import LRUCache
 import traceback
 
+_OUTFIELD_POSITIONS = tuple(pos for pos in REQUIRED_POSITIONS if pos in {'LF', 'CF', 'RF'})
+_INFIELD_POSITIONS = tuple(pos for pos in REQUIRED_POSITIONS if pos not in _OUTFIELD_POSITIONS)
+
+# Built rosters by (team_id, year), shared by every service so later games reuse them;
+# a season's roster, lineup and arsenal don't change
+_TEAM_CACHE: LRUCache = LRUCache(maxsize=64)
+_TEAM_CACHE_LOCK = threading.Lock()
+
 class TeamCreationService:
     """Handles creation of Team/TeamRoster objects"""
     def __init__(self, data_loader: TeamDataLoader, stats_service: CentralizedStatsService):
@@ -16,7 +28,24 @@ class TeamCreationService:
         self.lineup_optimizer = LineupOptimizer()
         
     def create_team(self, team_id, team_data: Dict, year: int, name: str) -> TeamRoster:
-        """Create a TeamRoster with Players"""
+        """Create a TeamRoster with Players, reusing the one built earlier for the same team and year"""
+        cache_key = (team_id, year)
+        with _TEAM_CACHE_LOCK:
+            cached = _TEAM_CACHE.get(cache_key)
+        if cached is None:
+            # Built outside the lock so the two sides of a matchup build concurrently
+            cached = self._build_team(team_id, team_data, year, name)
+            with _TEAM_CACHE_LOCK:
+                cached = _TEAM_CACHE.setdefault(cache_key, cached)
+
+        # Shallow copy: players, lineup and defense are shared, game position starts fresh
+        team = copy.copy(cached)
+        team.name = name
+        team._current_batter_index = 0
+        return team
+
+    def _build_team(self, team_id, team_data: Dict, year: int, name: str) -> TeamRoster:
+        """Build a TeamRoster from the loaded team data"""
         # First create all Player objects
         lineup = team_data.get('players', [])
         player_objects = [self._create_player(player, year) for player in lineup]
@@ -61,57 +90,49 @@ class TeamCreationService:
         Returns:
             List of Player objects assigned to defensive positions
         """
+        # Bucket roster indices by position once; each bucket keeps roster order
+        by_position = defaultdict(deque)
+        for index, player in enumerate(players):
+            by_position[player.position].append(index)
+
         defense = []
-        available_players = players[:]
-        outfield_positions = {'LF', 'CF', 'RF'}
-        assigned_positions = set()  
-        required_positions = set(REQUIRED_POSITIONS)
-        
-        for pos in required_positions:
-            if pos not in outfield_positions:
-                for player in available_players[:]:  
-                    if player.position == pos and pos not in assigned_positions:
-                        defense.append(player)
-                        assigned_positions.add(pos)
-                        available_players.remove(player)
-                        break
-        
-        available_outfielders = [p for p in available_players 
-                            if p.position in {'OF', 'LF', 'CF', 'RF'}]
-        
-        for pos in outfield_positions:
-            if pos not in assigned_positions:
-                specific_pos_player = next(
-                    (p for p in available_outfielders 
-                    if p.position == pos), 
-                    None
-                )
-                
-                if specific_pos_player and specific_pos_player in available_players:
-                    defense.append(specific_pos_player)
-                    assigned_positions.add(pos)
-                    available_outfielders.remove(specific_pos_player)
-                    available_players.remove(specific_pos_player)
-                
-                elif available_outfielders:
-                    of_player = next(
-                        (p for p in available_outfielders 
-                        if p.position == 'OF'),
-                        available_outfielders[0] if available_outfielders else None
-                    )
-                    
-                    if of_player and of_player in available_players:
-                        defense.append(of_player)
-                        assigned_positions.add(pos)
-                        available_outfielders.remove(of_player)
-                        available_players.remove(of_player)
-        
-        remaining_positions = required_positions - assigned_positions
-        for pos in remaining_positions:
-            if available_players:
-                player = available_players.pop(0)
-                defense.append(player)
-                assigned_positions.add(pos)
+        used = [False] * len(players)
+        unfilled = []
+
+        def take(index: int) -> None:
+            defense.append(players[index])
+            used[index] = True
+
+        for pos in _INFIELD_POSITIONS:
+            bucket = by_position.get(pos)
+            if bucket:
+                take(bucket.popleft())
+            else:
+                unfilled.append(pos)
+
+        # Outfield spots go to their own specialists first, then to generic OFs,
+        # then to the earliest remaining LF/CF/RF on the roster
+        open_outfield = []
+        for pos in _OUTFIELD_POSITIONS:
+            bucket = by_position.get(pos)
+            if bucket:
+                take(bucket.popleft())
+            else:
+                open_outfield.append(pos)
+
+        for pos in open_outfield:
+            bucket = by_position.get('OF')
+            if not bucket:
+                heads = [by_position[p] for p in _OUTFIELD_POSITIONS if by_position.get(p)]
+                bucket = min(heads, key=lambda candidates: candidates[0]) if heads else None
+            if bucket:
+                take(bucket.popleft())
+            else:
+                unfilled.append(pos)
+
+        remaining = (index for index, is_used in enumerate(used) if not is_used)
+        for _pos, index in zip(unfilled, remaining):
+            take(index)
         
         return defense
 
@@ -1,6 +1,6 @@
 from typing import List, Tuple
 from manager.batting_results import AtBatResult
-from manager.base_running import BaseState, BaseRunningManager
+from manager.base_running import BaseState, BaseRunningManager, classify_play
 from manager.roster_manager import TeamManager, TeamRoster
 from manager.player_manager import Player
 from stats.centralized_stats import CentralizedStatsService
@@ -21,17 +21,17 @@ class GameState:
         self.pitch_sequence = []
         self._current_batter_cache = None
         self._current_pitcher_cache = None
+        # Players built from raw dict entries, by (role, id), so a returning batter or pitcher is reused
+        self._players_by_id = {}
         self._scored_runners_cache = []
         self.team_manager = TeamManager(away_team_data, home_team_data)
   
         self.home_year = home_team_data.year
-        self.batting_order = self.current_batting_order
+        self._sync_half_inning()
     
         self.final_score = None
-        self.score = {
-            self.team_manager.away_team.name: 0,
-            self.team_manager.home_team.name: 0
-        }
+        self.away_score = 0
+        self.home_score = 0
         
         
         self.max_regulation_innings = 2 
@@ -48,27 +48,25 @@ class GameState:
     @property
     def batting_team(self) -> 'TeamRoster':
         """Get current batting team"""
-        return self.team_manager.batting_team
+        return self._batting_team
     
     @property
     def fielding_team(self) -> 'TeamRoster':
         """Get current fielding team"""
-        return self.team_manager.fielding_team
+        return self._fielding_team
+
+    def _sync_half_inning(self) -> None:
+        """Cache who is batting and fielding; only changes when the half-inning does"""
+        self.away_is_batting = self.top_of_inning
+        self._batting_team = self.team_manager.batting_team
+        self._fielding_team = self.team_manager.fielding_team
+        self.batting_team_name = self._batting_team.name
+        self.fielding_team_name = self._fielding_team.name
+        self.batting_order = self._batting_team._batter_lineup
     
            
     
     
-    @property
-    def current_batting_order(self) -> TeamRoster:
-        """Get current batting order based on inning state"""
-        if self.top_of_inning:
-            self.away_is_batting = True
-        else:
-            self.away_is_batting = False
-        self.team_manager._away_is_batting = self.away_is_batting
-        self.batting_order =self.team_manager.batting_team._batter_lineup
-        return self.batting_order
-    
     def _clear_cached_runners(self):
         """Clear the scored runners cache"""
         self._scored_runners_caches = []
@@ -80,7 +78,7 @@ class GameState:
         
     def get_batting_lineup(self):
         """Get current batting team's lineup"""
-        return self.current_batting_order
+        return self.batting_order
     
     def get_current_batter(self) -> Player:
         """Get current batter with cached stats"""
@@ -91,14 +89,18 @@ class GameState:
                     self._current_batter_cache = batter  
                 else:
                     player_data = batter.get('player', {})
-                    self._current_batter_cache = Player(
-                        id=player_data.get('id'),
-                        name=player_data.get('fullName'),
-                        position=player_data.get('position'),
-                        year=self.inning,
-                        batting_stats=self.stats_service.process_player_stats(batter, self.inning),
-                        pitching_stats=None
-                    )
+                    player = self._players_by_id.get(('batting', player_data.get('id')))
+                    if player is None:
+                        player = Player(
+                            id=player_data.get('id'),
+                            name=player_data.get('fullName'),
+                            position=player_data.get('position'),
+                            year=self.inning,
+                            batting_stats=self.stats_service.process_player_stats(batter, self.inning),
+                            pitching_stats=None
+                        )
+                        self._players_by_id[('batting', player.id)] = player
+                    self._current_batter_cache = player
         except Exception as e:
             raise e
      
@@ -112,14 +114,18 @@ class GameState:
                 pitcher_dict = self.team_manager.get_current_pitcher()
                 if isinstance(pitcher_dict, dict):
                     player_data = pitcher_dict.get('player', {})
-                    self._current_pitcher_cache = Player(
-                        id=player_data.get('id'),
-                        name=player_data.get('fullName'),
-                        position=player_data.get('position'),
-                        year=self.inning,  
-                        batting_stats=None,
-                        pitching_stats=player_data.get('stats', {})
-                    )
+                    player = self._players_by_id.get(('pitching', player_data.get('id')))
+                    if player is None:
+                        player = Player(
+                            id=player_data.get('id'),
+                            name=player_data.get('fullName'),
+                            position=player_data.get('position'),
+                            year=self.inning,  
+                            batting_stats=None,
+                            pitching_stats=player_data.get('stats', {})
+                        )
+                        self._players_by_id[('pitching', player.id)] = player
+                    self._current_pitcher_cache = player
                 else:
                     self._current_pitcher_cache = pitcher_dict
         except Exception as e:
@@ -156,32 +162,27 @@ class GameState:
             walk = 'walk' if play_result.final_result == 'walk' else ''
 
             if self.outs < 3:
-                advancement, scored_runners = BaseRunningManager.determine_advancement(
-                    play_type=base_movers if base_movers else walk,
+                # One table lookup moves the runners; each scorer is listed once, in the order they crossed
+                self.bases, scored_runners = BaseRunningManager.advance_runners(
+                    kind=classify_play(base_movers if base_movers else walk),
                     base_state=self.bases,
-                    outs=self.outs
-                    )
-    
-                if self.bases is None:
-                    self.bases = BaseState()
-    
-                self.bases = BaseRunningManager.update_base_state(
-                    current_state=self.bases,
-                    batter_name=self.current_batter,
-                    advancement=advancement,
-                    scored_runners=scored_runners
+                    batter_name=self.current_batter
                 )
                 
                 if scored_runners:
-                    scored_runners = list(set(scored_runners))  
                     play_result.add_scored_runners(scored_runners)
                     self.scored_runners = scored_runners
-                    self.score[self.batting_team.name] += len(scored_runners)
+                    if self.away_is_batting:
+                        self.away_score += len(scored_runners)
+                    else:
+                        self.home_score += len(scored_runners)
     
             self.batter_stats = play_result.batter_stats
             self.pitcher_stats = play_result.pitcher_stats
-            self.pitch_sequence = play_result.pitch_sequence.copy()
-            self._scored_runners_cache = self.scored_runners.copy()
+            # Aliased rather than copied: pitch_sequence is a fresh list per at-bat and
+            # self.scored_runners is rebound (never mutated) below
+            self.pitch_sequence = play_result.pitch_sequence
+            self._scored_runners_cache = self.scored_runners
 
             self._clear_player_cache()
             next_batter = self.team_manager.advance_batter()
@@ -211,56 +212,54 @@ class GameState:
         if self.top_of_inning:
             self.top_of_inning = False
         else:
+            # A tie after a full inning at or past the scheduled length means another inning
+            if self.inning >= self.max_innings and self.home_score == self.away_score:
+                self.max_innings += 1
             self.top_of_inning = True
             self.inning += 1
             
         # Switch teams in manager
         self.team_manager.switch_teams()
+        self._sync_half_inning()
         
     def is_game_over(self) -> bool:
         if self.inning >= self.max_regulation_innings + self.max_extra_innings:
             return True
-
         if self.inning < self.max_regulation_innings:
             return False
 
-        if not self.top_of_inning:
-            if self.is_home_team_ahead():
-                return True
-            if self.is_tied() and self.outs < 3:
-                return False
-            if self.is_tied() and self.outs >= 3:
-                if self.inning < self.max_regulation_innings + self.max_extra_innings:
-                    self.max_innings += 1  
-                    return False
-                return True  
-            
-        else:
-            if self.outs >= 3 and self.is_home_team_ahead():
-                return True
-            return False
-
-        return False
+        run_diff = self.home_score - self.away_score
+        if self.top_of_inning:
+            return self.outs >= 3 and run_diff > 0
+        return run_diff > 0
     
     
     def is_tied(self) -> bool:
-        return self.score[self.team_manager.home_team.name] == self.score[self.team_manager.away_team.name]
+        return self.home_score == self.away_score
     
     def is_home_team_ahead(self) -> bool:
-        return self.score[self.team_manager.home_team.name] > self.score[self.team_manager.away_team.name]
+        return self.home_score > self.away_score
    
     def _format_base_state(self) -> List[str]:
         """Format current base state for display"""
         base_list = []
         base_names = ['first', 'second', 'third']
         
-        for i, base in enumerate(self.bases._bases):
+        for i, base in enumerate(self.bases.to_list()):
             if base:
                 base_list.append(f"{base} on {base_names[i]}")
         
         return base_list if base_list else []
     @property
+    def score(self) -> dict:
+        """Score keyed by team name, built on demand for display and events"""
+        return {
+            self.team_manager.away_team.name: self.away_score,
+            self.team_manager.home_team.name: self.home_score
+        }
+
+    @property
     def current_score(self) -> str:
         """Get formatted current score"""
-        return (f"{self.team_manager.away_team.name}: {self.score[self.team_manager.away_team.name]}, "
-                f"{self.team_manager.home_team.name}: {self.score[self.team_manager.home_team.name]}")
\ No newline at end of file
+        return (f"{self.team_manager.away_team.name}: {self.away_score}, "
+                f"{self.team_manager.home_team.name}: {self.home_score}")
\ No newline at end of file
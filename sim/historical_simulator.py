@@ -1,4 +1,5 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from data.data_loader import TeamDataLoader
 from sim.game_state import GameState
@@ -6,6 +7,7 @@ from stats.centralized_stats import CentralizedStatsService
 from sim.simulator import EnhancedGameSimulator
 from services.team_creation_service import TeamCreationService
 from services.game_statistics_summary import GameStatsManager
+from manager.batting_results import render_stat_table, BATTER_TABLE_FORMAT, PITCHER_TABLE_FORMAT
 from calculations.venue_data import VenueData
 from events.game_events import EventManager
 from utils.gemini_config import get_llm
@@ -32,7 +34,9 @@ class MatchupResult:
 class HistoricalMatchupSimulator:
     """Simulates matchups between historical MLB teams"""
     
-    def __init__(self):
+    def __init__(self, play_delay: float = 0.0):
+        # Seconds to pause after each emitted play; only the live UI wants pacing
+        self.play_delay = play_delay
         self.team_data_loader = TeamDataLoader()
         self.stats_service = CentralizedStatsService() 
         self.game_simulator = EnhancedGameSimulator(self.stats_service)
@@ -46,18 +50,21 @@ class HistoricalMatchupSimulator:
             away_id = away_team
             home_id = home_team
             
-            away_data = self.team_data_loader.load_complete_team_data(away_team, away_year)
-            home_data = self.team_data_loader.load_complete_team_data(home_team, home_year)
-            
-            venue_data = self.team_data_loader.get_venue_data(home_team, home_year)
+            away_data, home_data, venue_data = self.team_data_loader.load_matchup_data(
+                away_team, away_year, home_team, home_year
+            )
 
             venue_details = VenueData.from_api_response(venue_data)
             
             if not away_data or not home_data:
                 raise ValueError("Could not find team data")
 
-            away_team = self.team_creation_service.create_team(away_id, away_data, away_year, team1_name)
-            home_team = self.team_creation_service.create_team(home_id, home_data, home_year, team2_name)
+            # Both rosters build player stats and fetch a pitch arsenal, so create them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                away_future = executor.submit(self.team_creation_service.create_team, away_id, away_data, away_year, team1_name)
+                home_future = executor.submit(self.team_creation_service.create_team, home_id, home_data, home_year, team2_name)
+                away_team = away_future.result()
+                home_team = home_future.result()
                  
             game_state = GameState(away_team, home_team, self.stats_service)
             game_state.venue = venue_details
@@ -67,11 +74,20 @@ class HistoricalMatchupSimulator:
         except Exception as e:
             raise ValueError(f"Error initializing game: {str(e)}")
 
-    def simulate_matchup(self, team1_id: int, year1: int, team2_id: int, year2: int, team1_name: str, team2_name: str, api_key: str = None) -> Dict:
+    def simulate_matchup_fast(self, team1_id: int, year1: int, team2_id: int, year2: int, team1_name: str, team2_name: str) -> Dict:
+        """Simulate a matchup without pausing between plays, for batch and analysis runs"""
+        return self.simulate_matchup(team1_id, year1, team2_id, year2, team1_name, team2_name, play_delay=0.0)
+
+    def simulate_matchup(self, team1_id: int, year1: int, team2_id: int, year2: int, team1_name: str, team2_name: str, api_key: str = None,
+                         play_delay: Optional[float] = None) -> Dict:
         try:
+            if play_delay is None:
+                play_delay = self.play_delay
             game_stats_manager = GameStatsManager(home_team=team2_name, away_team=team1_name)
 
             game_state = self.initialize_game(team1_id, year1, team2_id, year2, team1_name, team2_name)
+            # Stat tables depend only on the two players' season stats, so build each pairing once
+            stat_tables = {}
 
             while not game_state.is_game_over():
                 current_batter = game_state.get_current_batter()
@@ -79,10 +95,20 @@ class HistoricalMatchupSimulator:
                 
                 batter_stats = game_state.batting_team.get_stats(current_batter, 'batting')
                 pitcher_stats = game_state.fielding_team.get_stats(current_pitcher, 'pitching')
-                pitcher_df, batter_df = self.stats_service.get_formatted_stat_tables(
-                    batter_stats, 
-                    pitcher_stats
-                )
+                table_key = (current_batter.id, current_pitcher.id)
+                tables = stat_tables.get(table_key)
+                if tables is None:
+                    pitcher_df, batter_df = self.stats_service.get_formatted_stat_tables(
+                        batter_stats, 
+                        pitcher_stats
+                    )
+                    # The HTML for a pairing is the same every time it comes up, so render it with the tables
+                    tables = stat_tables[table_key] = (
+                        pitcher_df, batter_df,
+                        render_stat_table(pitcher_df, PITCHER_TABLE_FORMAT),
+                        render_stat_table(batter_df, BATTER_TABLE_FORMAT)
+                    )
+                pitcher_df, batter_df, pitcher_html, batter_html = tables
                 
                 
                 
@@ -97,6 +123,8 @@ class HistoricalMatchupSimulator:
                 )
                 play_result.batter_df = batter_df
                 play_result.pitcher_df = pitcher_df
+                play_result.batter_table_html = batter_html
+                play_result.pitcher_table_html = pitcher_html
 
                 play_details = {
                     'inning': game_state.inning,
@@ -104,11 +132,10 @@ class HistoricalMatchupSimulator:
                     'outs': game_state.outs,
                     'base_state': game_state._format_base_state(),
                     'pitch_sequence': play_result.pitch_sequence,
-                    'batting_team_name': game_state.batting_team.name,
-                    'fielding_team_name': game_state.fielding_team.name,
+                    'batting_team_name': game_state.batting_team_name,
+                    'fielding_team_name': game_state.fielding_team_name,
                     'batting_team_lineup': game_state.get_batting_lineup(),
                     'fielding_team_lineup': game_state.get_current_defense(),
-                    'current_score': game_state.score,
                     'batter': current_batter.get('player', {}).get('fullName'),
                     'pitcher': current_pitcher.get('player', {}).get('fullName'),
                     'result': play_result.to_dict(),
@@ -128,8 +155,8 @@ class HistoricalMatchupSimulator:
                     'final_result': play_result.final_result,
                     'final_hit': play_result.final_hit,
                     'final_fielded_out': play_result.final_fielded_out,
-                    'batting_team': game_state.batting_team.name,
-                    'fielding_team': game_state.fielding_team.name,
+                    'batting_team': game_state.batting_team_name,
+                    'fielding_team': game_state.fielding_team_name,
                     'scored_runners': game_state._scored_runners_cache,  
                     'pitch_count': play_result.pitch_count,
                     'final_pitch_velocity': play_result.final_pitch_velocity,
@@ -141,12 +168,15 @@ class HistoricalMatchupSimulator:
                 game_stats_manager.record_play(stats_details)
                 
                 play_result_str, final_outs = game_state.update(play_result)
+                # Taken after update so the event carries the score including this play
+                play_details['current_score'] = game_state.score
                 
                 self.event_manager.emit('play_result', {
                     'play_details': play_details
                 })
 
-                sleep(7)
+                if play_delay > 0:
+                    sleep(play_delay)
                 
             game_summary, llm_analysis = game_stats_manager.generate_summary(
                 final_score=game_state.score,
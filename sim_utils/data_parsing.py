@@ -6,6 +6,8 @@ import traceback
 from typing import Dict, List, Set
 from constants import STRIKEOUT_TERMS, MAX_STRIKES, MAX_BALLS, VALID_RESULTS, HIT_TERMS, FIELDED_OUT_TERMS, RAW_PITCH_CODES, DEFAULT_PITCH_VELOCITY, map_action
 
+_RAW_PITCH_CODE_CHOICES = tuple(RAW_PITCH_CODES)
+
 def create_default_pitch_sequence(pitch_count: int) -> Dict:
     """Create a default pitch sequence for an at-bat"""
     try:
@@ -14,7 +16,7 @@ def create_default_pitch_sequence(pitch_count: int) -> Dict:
         pitch_details = {}
         
         for i in range(pitch_count):
-            pitch_type = random.choice(list(RAW_PITCH_CODES))
+            pitch_type = random.choice(_RAW_PITCH_CODE_CHOICES)
             
             if strikes < MAX_STRIKES  and balls < MAX_BALLS:
                 hit_type = random.choice(['strike', 'ball'])
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 import logging
+import sys
 from constants import PITCH_CODES
 
 logger = logging.getLogger(__name__)
@@ -377,35 +378,25 @@ class PitchingStats():
             return cls(year=year)
 
                 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Pitch:
     """Individual pitch type information"""
-    _code: str
-    _name: str
-    _percentage: float = 0.0
-    _avg_speed: float = 0.0
-    
-    def __init__(self, code: str, name: str, percentage: float = 0.0, avg_speed: float = 0.0):
-        self._code = code
-        self._name = name 
-        self._percentage = percentage
-        self._avg_speed = avg_speed
-        
-    @property
-    def code(self) -> str:
-        return self._code
-    
-    @property
-    def name(self) -> str:
-        return self._name
-    
-    @property 
-    def percentage(self) -> float:
-        return self._percentage
-    
-    @property
-    def avg_speed(self) -> float:
-        return self._avg_speed
+    code: str
+    name: str
+    percentage: float = 0.0
+    avg_speed: float = 0.0
+
+    def __getitem__(self, key: str) -> Any:
+        """Dictionary-style item access, so Pitch objects and API pitch dicts read the same"""
+        return getattr(self, key)
+
+# Shared, immutable pitches behind every default arsenal
+_DEFAULT_PITCHES = (
+    Pitch('FF', 'Four-Seam Fastball', 50.0, 93.5),
+    Pitch('SL', 'Slider', 20.0, 85.0),
+    Pitch('CH', 'Changeup', 15.0, 83.0),
+    Pitch('CU', 'Curveball', 15.0, 78.0),
+)
         
 @dataclass
 class PitchArsenal:
@@ -434,32 +425,7 @@ class PitchArsenal:
     def get_default_arsenal(cls) -> Dict:
         """Create default pitch arsenal dictionary"""
         return {
-            'pitches': {
-                'FF': {
-                    'code': 'FF',
-                    'name': 'Four-Seam Fastball',
-                    'percentage': 50.0,
-                    'avg_speed': 93.5
-                },
-                'SL': {
-                    'code': 'SL',
-                    'name': 'Slider',
-                    'percentage': 20.0,
-                    'avg_speed': 85.0
-                },
-                'CH': {
-                    'code': 'CH',
-                    'name': 'Changeup',
-                    'percentage': 15.0,
-                    'avg_speed': 83.0
-                },
-                'CU': {
-                    'code': 'CU',
-                    'name': 'Curveball',
-                    'percentage': 15.0,
-                    'avg_speed': 78.0
-                }
-            },
+            'pitches': {pitch.code: pitch for pitch in _DEFAULT_PITCHES},
             'primary_pitch': 'FF'
         }
     
@@ -498,7 +464,7 @@ class PitchArsenal:
                 pitch_type = stat.get('type', {})
                 
                 if pitch_type:
-                    code = pitch_type.get('code', '')
+                    code = sys.intern(pitch_type.get('code', ''))
                     percentage = float(stat.get('percentage', 0)) * 100
                     speed = float(stat.get('averageSpeed', 0))
                     
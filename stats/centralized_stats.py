@@ -2,7 +2,7 @@ from typing import Dict, Union, Tuple, List, Optional
 import pandas as pd
 from stats.base_stats import BattingStats, PitchingStats, PitchArsenal
 from manager.player_manager import Player
-from constants import DEFAULT_STATS, DEFAULT_ARSENAL, DEFAULT_METRICS
+from constants import DEFAULT_STATS, DEFAULT_ARSENAL, DEFAULT_METRICS, thaw
 import logging
 import warnings
 import traceback
@@ -49,7 +49,7 @@ class CentralizedStatsService:
     
     def process_metrics(self, stats_sections: List) -> Dict:
         """Process and aggregate metrics from multiple entries"""
-        metrics_dict = DEFAULT_METRICS.copy()
+        metrics_dict = thaw(DEFAULT_METRICS)
         
         metrics = next((
             stat for stat in stats_sections
@@ -273,7 +273,7 @@ class CentralizedStatsService:
     def _create_default_stats_dict(self) -> Dict:
         """Create a default stats dictionary with realistic MLB averages"""
         
-        return DEFAULT_STATS['hitting']
+        return thaw(DEFAULT_STATS['hitting'])
 
     def _create_default_tables(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Create default DataFrames for display using realistic MLB averages"""
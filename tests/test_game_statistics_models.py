@@ -0,0 +1,51 @@
+import unittest
+from dataclasses import asdict
+from services.game_statistics_models import (
+    AdvancedMetrics, GameAtBatStats, GamePitchingStats, GamePlayer, PlayerPerformance
+)
+
+
+class PlayerPerformanceRoundTripTest(unittest.TestCase):
+    def _performance(self) -> PlayerPerformance:
+        pitching = GamePitchingStats(innings_pitched=2.0, pitches_thrown=30, strikeouts=3)
+        for velocity in (92.5, 94.0, 88.5):
+            pitching.add_pitch_velocity(velocity)
+        return PlayerPerformance(
+            name='Pitcher One',
+            team='Home',
+            score=4.5,
+            highlights=['Struck out 3'],
+            stats={'batting': GameAtBatStats(hits=1, singles=1), 'pitching': pitching},
+            player_id=7,
+            pitcher_score=6.0,
+            advanced_metrics=AdvancedMetrics(pitch_velocity_metrics={'avg': 91.67})
+        )
+
+    def test_from_dict_round_trips_to_dict(self):
+        data = self._performance().to_dict()
+        restored = PlayerPerformance.from_dict(dict(data))
+        self.assertIsInstance(restored.stats['batting'], GameAtBatStats)
+        self.assertIsInstance(restored.stats['pitching'], GamePitchingStats)
+        self.assertEqual(restored.to_dict(), data)
+
+    def test_restored_pitching_stats_keep_velocity_total(self):
+        restored = PlayerPerformance.from_dict(self._performance().to_dict())
+        self.assertAlmostEqual(restored.stats['pitching'].avg_pitch_velocity, 275.0 / 3)
+
+    def test_from_dict_without_stats(self):
+        data = PlayerPerformance(name='Bench', team='Away', score=0.0).to_dict()
+        self.assertEqual(PlayerPerformance.from_dict(dict(data)).to_dict(), data)
+
+
+class PrivateStateSerializationTest(unittest.TestCase):
+    def test_asdict_skips_private_state(self):
+        pitching = GamePitchingStats()
+        pitching.add_pitch_velocity(95.0)
+        player = GamePlayer(player_id=1, name='Pitcher One', team='Home', position='P')
+        self.assertNotIn('_velocity_sum', asdict(pitching))
+        self.assertNotIn('_stats_dirty', asdict(player))
+        self.assertNotIn('_velocity_sum', asdict(player)['pitching_stats'])
+
+
+if __name__ == '__main__':
+    unittest.main()
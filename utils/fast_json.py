@@ -0,0 +1,42 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when available, falling back to the stdlib"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> Union[bytes, str]:
+    """Encode JSON with orjson when available, falling back to the stdlib"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value)
+
+
+def dumps_str(value: Any) -> str:
+    """Encode JSON to str, stringifying any value the encoder can't handle natively"""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(value, default=str)
+
+
+class SocketIOJSON:
+    """json-module stand-in for python-socketio, which expects dumps to return str"""
+
+    @staticmethod
+    def dumps(value: Any, **kwargs) -> str:
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(value, **kwargs)
+
+    @staticmethod
+    def loads(data: Union[bytes, str], **kwargs) -> Any:
+        return loads(data)